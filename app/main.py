@@ -76,6 +76,7 @@ async def pong():
 @app.on_event("shutdown")
 async def app_shutdown():
     cms_client.logout()
+    cms_client.close()
 
 
 if __name__ == "__main__":
@@ -1,11 +1,24 @@
 # Standard Library Imports
+import asyncio
+import itertools
 import json
-import random
+import logging
+import operator
+import socket
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable
+from xml.parsers import expat
 
 # Third Party Imports
 import requests
-import xmltodict
-from pydash.objects import get
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 
 # Local App Imports
 from app.models.exceptions import (
@@ -30,83 +43,911 @@ from app.models.ont import (
     OntVoice,
     OntList,
 )
-from app.services.environment import CMS_IP, CMS_PASSWORD, CMS_USERNAME
+from app.services import payloads
+from app.services.environment import CMS_IP, CMS_NODES, CMS_PASSWORD, CMS_USERNAME
+
+logger = logging.getLogger(__name__)
+
+# CMS sessions expire after an hour, cached session ids are dropped a little before that. A shared session's age counts
+# from the last time a client logged in with it.
+SESSION_TTL = 3500
+
+# Session ids shared between CmsClient instances, keyed by (netconf url, username, password). Each entry also holds
+# the clients using the session, it is only logged out on the CMS once the last of them logs out.
+_SESSION_CACHE: dict[tuple[str, str, str], tuple[str, float, weakref.WeakSet]] = {}
+_SESSION_LOCK = threading.Lock()
+
+# Message ids only have to be unique within a CMS session, and sessions are shared between clients, so one counter
+# serves every client.
+_MESSAGE_IDS = itertools.count(1)
+
+# Size of the pieces a response body is read and parsed in.
+RESPONSE_CHUNK_SIZE = 64 * 1024
+
+# Charset request payloads are encoded in, matches the Content-Type header.
+PAYLOAD_ENCODING = "iso-8859-1"
+
+# Connections kept open to the CMS for reuse, enough for an AsyncCmsClient at its default concurrency.
+POOL_SIZE = 32
+
+# Times a request is retried when the connection to the CMS could not be made. Requests that reached the CMS are never
+# resent, since most of them change the node.
+CONNECT_RETRIES = 2
+
+# Ont configuration rarely changes, get_ont and get_ont_port results are reused for this many seconds.
+CONFIG_TTL = 300
+CONFIG_CACHE_SIZE = 10_000
+
+# Dashboards poll the same onts and modems repeatedly, get_ont_status, get_ont_performance, get_xdsl_status and
+# get_xdsl_performance results are reused for this many seconds.
+STATUS_TTL = 5
+STATUS_CACHE_SIZE = 10_000
+
+
+# Key paths into parsed replies, see get_path.
+AUTH_REPLY = tuple("Envelope.Body.auth-reply".split("."))
+AUTH_RESULT_CODE = ("ResultCode",)
+AUTH_SESSION_ID = ("SessionId",)
+RPC_REPLY = tuple("soapenv:Envelope.soapenv:Body.rpc-reply".split("."))
+ACTION_REPLY = RPC_REPLY + ("action-reply",)
+COUNTER_TYPES = ("types",)
+COUNTER_VALUES = ("bin", "val")
+ACTION_REPLY_ALARMS = ACTION_REPLY + ("alarm",)
+DATA_OBJECT = RPC_REPLY + ("data", "top", "object")
+DATA_OBJECT_CHILDREN = DATA_OBJECT + ("children",)
+DATA_OBJECT_CHILD = DATA_OBJECT_CHILDREN + ("child",)
+ONT_ID = ("id", "ont")
+DSL_PORT_ID = ("id",)
+
+# Paths of the configured and realtime ont objects in a show-ont reply.
+ONT_STATUS_CONFIG_PATH = ACTION_REPLY + ("match", "get-config", "object")
+ONT_STATUS_OBJECT_PATH = ACTION_REPLY + ("match", "get", "object")
+
+
+def get_path(data, keys: tuple[str, ...], default=None):
+    """
+    Reads a value from nested dicts, a faster version of get for paths split ahead of time.
+    :param data: Parsed response, or part of one.
+    :param keys: Keys to follow. Ex: ("soapenv:Envelope", "soapenv:Body", "rpc-reply")
+    :param default: Returned when the path is not present.
+    :return: The value at the path.
+    """
+    for key in keys:
+        if not isinstance(data, dict) or key not in data:
+            return default
+        data = data[key]
+    return data
+
+
+# Coercers for boolean fields, False when the value is missing. operator.eq is used rather than "true".__eq__, which
+# returns NotImplemented (truthy) for None.
+is_true = partial(operator.eq, "true")
+is_false = partial(operator.eq, "false")
+
+
+class FieldSpec(tuple):
+    """
+    Compiled field table, a tuple of (field name, key path, coercer or None) tuples. build reads every field of the
+    table from a parsed reply, see field_spec.
+    """
+
+    build: Callable[[object], dict]
+
+
+def field_spec(fields: dict) -> FieldSpec:
+    """
+    Compiles a table of model fields for build_fields.
+    :param fields: Mapping of field name to the dotted path it is read from, or to a (path, coercer) tuple when the
+    value needs converting. Ex: {"admin": "admin", "hot_swap": ("hot-swap", is_true)}
+    :return: FieldSpec of the fields.
+    """
+    spec = []
+    for name, path in fields.items():
+        path, coerce = path if isinstance(path, tuple) else (path, None)
+        spec.append((name, tuple(path.split(".")), coerce))
+    spec = FieldSpec(spec)
+
+    # Generate a function that reads every field with straight-line code, instead of looping over the key paths of
+    # the table for every reply
+    lines = ["def build(data):", "    fields = {}"]
+    namespace = {}
+    for i, (name, path, coerce) in enumerate(spec):
+        lines.append("    value = data")
+        for key in path:
+            lines.append(
+                f"    value = value.get({key!r}) if isinstance(value, dict) else None"
+            )
+        if coerce is is_true or coerce is is_false:
+            lines.append(f"    fields[{name!r}] = value == {coerce.args[0]!r}")
+        elif coerce:
+            namespace[f"coerce_{i}"] = coerce
+            lines.append(f"    fields[{name!r}] = coerce_{i}(value)")
+        else:
+            lines.append(f"    fields[{name!r}] = value")
+    lines.append("    return fields")
+    exec("\n".join(lines), namespace)
+    spec.build = namespace["build"]
+    return spec
+
+
+def build_fields(data, spec: FieldSpec) -> dict:
+    """
+    Reads every field of a compiled field table from data.
+    :param data: Parsed response, or part of one.
+    :param spec: Field table from field_spec.
+    :return: Mapping of field name to its value, None when missing.
+    """
+    return spec.build(data)
+
+
+def field_paths(root: tuple[str, ...], spec: FieldSpec) -> list[tuple[str, ...]]:
+    """
+    Lists the key paths a field table reads below root.
+    :param root: Key path of the object the table is relative to.
+    :param spec: Field table from field_spec.
+    :return: list of key paths.
+    """
+    return [root + path for _, path, _ in spec]
+
+
+# Element and attribute names shared by every parser, so names in replies are the same str objects as the keys of the
+# select trees and dict lookups on them succeed on identity without comparing characters.
+ELEMENT_NAMES: dict[str, str] = {}
+
+
+def select_paths(paths: list[tuple[str, ...]]) -> dict:
+    """
+    Converts key paths into the tree of element names parse_paths keeps. Trailing attribute keys (@name) are dropped
+    since attributes are kept with their element.
+    :param paths: Key paths as used with get_path. Ex: [("a", "b", "@name"), ("a", "c")]
+    :return: Nested dict of element names, True marks an element that is kept entirely. Ex: {"a": {"b": True, "c": True}}
+    """
+    selected = {}
+    for path in paths:
+        while path[-1].startswith("@"):
+            path = path[:-1]
+        path = tuple(ELEMENT_NAMES.setdefault(name, name) for name in path)
+        node = selected
+        for name in path[:-1]:
+            child = node.setdefault(name, {})
+            if child is True:
+                break
+            node = child
+        else:
+            node[path[-1]] = True
+    return selected
+
+
+def parse_paths(chunks, paths: dict, force_list: frozenset[str] = frozenset()) -> dict:
+    """
+    Parses an xml document into the same structure as xmltodict.parse, but only keeps the elements on paths (with
+    everything below them) and their ancestors. Every other subtree is skipped without building anything for it.
+    :param chunks: Iterable of bytes making up the document.
+    :param paths: Element paths to keep, see select_paths. True keeps the whole document.
+    :param force_list: Names of elements on paths that are always put in a list, even when there is only one of them.
+    Elements inside a subtree that is kept entirely are not affected.
+    :return: Parsed document, {} if none of the paths are present.
+    """
+    # Selected children of every open element that is an ancestor of a kept element
+    nodes = [paths]
+    stack = []
+    item, data = None, []
+    skipped = 0  # Depth inside a subtree that is not kept
+    kept = 1 if paths is True else 0  # Depth inside a subtree that is kept entirely
+
+    def push(parent, key, value, as_list=False):
+        if parent is None:
+            parent = {}
+        if key not in parent:
+            parent[key] = [value] if as_list else value
+        elif isinstance(parent[key], list):
+            parent[key].append(value)
+        else:
+            parent[key] = [parent[key], value]
+        return parent
+
+    def start_element(name, attrs):
+        nonlocal item, data, skipped, kept
+        if skipped:
+            skipped += 1
+            return
+
+        if kept:
+            kept += 1
+        else:
+            node = nodes[-1].get(name)
+            if node is None:
+                skipped = 1
+                return
+            if node is True:
+                kept = 1
+            else:
+                nodes.append(node)
+
+        stack.append((item, data))
+        item = {f"@{key}": value for key, value in attrs.items()} or None
+        data = []
+
+    def end_element(name):
+        nonlocal item, data, skipped, kept
+        if skipped:
+            skipped -= 1
+            return
+        as_list = kept <= 1 and name in force_list
+        if kept:
+            kept -= 1
+        else:
+            nodes.pop()
+
+        text = "".join(data).strip() or None
+        element = item
+        item, data = stack.pop()
+        if element is not None:
+            if text:
+                push(element, "#text", text)
+            item = push(item, name, element, as_list)
+        else:
+            item = push(item, name, text, as_list)
+
+    def character_data(text):
+        if not skipped:
+            data.append(text)
+
+    parser = expat.ParserCreate(intern=ELEMENT_NAMES)
+    parser.buffer_text = True
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.CharacterDataHandler = character_data
+    for chunk in chunks:
+        parser.Parse(chunk, False)
+    parser.Parse(b"", True)
+
+    return item if item is not None else {}
+
+
+class MarkerScanner:
+    """
+    Watches a body streamed in chunks for a marker, such as the <more/> pagination marker, which may be split across
+    chunks. Chunks are searched in place, only the few bytes around each chunk boundary are joined.
+    """
+
+    def __init__(self, marker: bytes):
+        self.marker = marker
+        self.found = False
+        self._tail = b""
+
+    def feed(self, chunk: bytes) -> bytes:
+        """
+        Searches the next chunk of the body for the marker.
+        :param chunk: The next chunk of the body.
+        :return: The chunk, unchanged.
+        """
+        if self.found:
+            return chunk
+
+        # The tail holds the last len(marker) - 1 bytes seen, as much of a marker as can start before this chunk
+        keep = len(self.marker) - 1
+        self.found = self.marker in chunk or self.marker in self._tail + chunk[:keep]
+        self._tail = (self._tail + chunk[-keep:])[-keep:]
+        return chunk
+
+
+# OntGeneral fields and their paths relative to an Ont object in a reply.
+ONT_GENERAL_FIELDS = field_spec(
+    {
+        "admin_state": "admin",
+        "model_nr": "ontprof.id.ontprof.@name",
+        "serial_nr": "serno",
+        "registration_id": "reg-id",
+        "subscriber_id": "subscr-id",
+        "description": "descr",
+        "vendor": "vendor",
+        "shelf": "linked-pon.id.shelf",
+        "card": "linked-pon.id.card",
+        "port": "linked-pon.id.gponport",
+        "pwe3prof": "pwe3prof",
+        "low_rx_opt_pwr_ne_thresh": "low-rx-opt-pwr-ne-thresh",
+        "high_rx_opt_pwr_ne_thresh": "high-rx-opt-pwr-ne-thresh",
+        "us_sdber_rate": "us-sdber-rate",
+        "low_rx_opt_pwr_fe_thresh": "low-rx-opt-pwr-fe-thresh",
+        "high_rx_opt_pwr_fe_thresh": "high-rx-opt-pwr-fe-thresh",
+        "low_tx_opt_pwr_thresh": "low-tx-opt-pwr-thresh",
+        "high_tx_opt_pwr_thresh": "high-tx-opt-pwr-thresh",
+        "low_laser_bias_thresh": "low-laser-bias-thresh",
+        "high_laser_bias_thresh": "high-laser-bias-thresh",
+        "low_line_pwr_feed_thresh": "low-line-pwr-feed-thresh",
+        "high_line_pwr_feed_thresh": "high-line-pwr-feed-thresh",
+        "low_ont_temp_thresh": "low-ont-temp-thresh",
+        "high_ont_temp_thresh": "high-ont-temp-thresh",
+        "pse_max_power_budget": "pse-max-power-budget",
+        "poe_class_control": "poe-class-control",
+        "ont_port_color": "ont-port-color",
+        "battery_present": ("serno", is_true),
+    }
+)
+
+# OntStatus fields and their paths relative to the "get" object of a show-ont reply.
+ONT_STATUS_FIELDS = field_spec(
+    {
+        "operational_status": "op-stat",
+        "critical_alarm_count": "crit",
+        "major_alarm_count": "maj",
+        "minor_alarm_count": "min",
+        "warning_alarm_count": "warn",
+        "info_alarm_count": "info",
+        "derived_states": "derived-states",
+        "clei": "clei",
+        "product_code": "product-code",
+        "mfg_serial_number": "mfg-serno",
+        "uptime": "uptime",
+        "rx_opt_signal_level": "opt-sig-lvl",
+        "tx_opt_signal_level": "tx-opt-lvl",
+        "loop_length": "range-length",
+        "fe_opt_signal_level": "fe-opt-lvl",
+        "ds_sdber_rate": "cur-ds-sdber-rate",
+        "current_software_version": "curr-sw-vers",
+        "alternate_software_version": "alt-sw-vers",
+        "rg_config_file_version": "rg-file-vers",
+        "voip_config_file_version": "voip-file-vers",
+        "current_customer_version": "curr-cust-vers",
+        "alternate_customer_version": "alt-cust-vers",
+        "onu_mac_address": "onu-mac",
+        "mta_mac_address": "mta-mac",
+        "response_time": "response-time",
+        "pse_available_power_budget": "pse-available-power-budget",
+        "pse_aggregate_output_power": "pse-aggregate-output-power",
+        "pse_management_capability": "pse-mgmt-capb",
+        "option": "option",
+        "current_committed": ("curr-cust-vers", is_true),
+    }
+)
+
+
+# OntPerformance fields and their names in the performance counters of a show-ont-pm reply.
+ONT_PERFORMANCE_FIELDS = field_spec(
+    {
+        "bip_errors_up": "bip-err-up",
+        "bip_errors_down": "bip-err-down",
+        "bip_errored_seconds_up": "bip-err-sec-up",
+        "bip_errored_seconds_down": "bip-err-sec-down",
+        "bip_severely_errored_seconds_up": "bip-sev-err-sec-up",
+        "bip_severely_errored_seconds_down": "bip-sev-err-sec-down",
+        "bip_unavailable_seconds_up": "bip-unavail-sec-up",
+        "bip_unavailable_seconds_down": "bip-unavail-sec-down",
+        "missed_bursts_up": "miss-burst-up",
+        "missed_bursts_seconds": "missed-burst-sec",
+        "gem_hec_errors_up": "gem-hec-err-up",
+    }
+)
+
+
+# OntPort fields and their paths relative to an OntEthGe object in a reply.
+ONT_PORT_FIELDS = field_spec(
+    {
+        "slot": "id.ontslot",
+        "port_number": "id.ontethge",
+        "admin": "admin",
+        "subscriber_id": "subscr-id",
+        "description": "descr",
+        "speed": "speed",
+        "duplex": "duplex",
+        "disable_on_battery": ("disable-on-batt", is_true),
+        "link_oam_events": ("link-oam-events", is_true),
+        "accept_link_oam_loopbacks": ("accept-link-oam-loopbacks", is_true),
+        "intf": "intf",
+        "dhcp_limit_override": "dhcp-limit-override",
+        "downstream_bandwidth_profile": "ds-bw-prof",
+        "force_dot1x": "force-dot1x",
+        "role": "role",
+        "policing": "policing",
+        "poe_power_priority": "poe-power-priority",
+        "poe_class_control": "poe-class-control",
+        "voice_policy_profile": "voice-policy-profile",
+        "ppte_power_control": ("ppte-power-control", is_false),
+        "ont_port_color": "ont-port-color",
+    }
+)
+
+
+# OntService fields and their paths relative to an EthSvc child object in a reply.
+ONT_SERVICE_FIELDS = field_spec(
+    {
+        "admin": "admin",
+        "description": "descr",
+        "service_name": "id.ethsvc.@name",
+        "service_text": "id.ethsvc.#text",
+        "bandwidth_name": "bw-prof.id.bwprof.@name",
+        "bandwidth_text": "bw-prof.id.bwprof.#text",
+        "bandwidth_id": "bw-prof.id.bwprof.@localId",
+        "out_tag": "out-tag",
+        "in_tag": "in-tag",
+        "mcast_profile": "mcast-prof",
+        "pon_cos": "pon-cos",
+        "upstream_cir_override": "us-cir-override",
+        "upstream_pir_override": "us-pir-override",
+        "downstream_pir_override": "ds-pir-override",
+        "hot_swap": ("hot-swap", is_true),
+        "pppoe_force_discard": ("pppoe-force-discard", is_true),
+    }
+)
+
+
+# OntVoice fields and their paths relative to an OntPots object in a reply.
+ONT_VOICE_FIELDS = field_spec(
+    {
+        "admin": "admin",
+        "subscriber_id": "subscr-id",
+        "description": "descr",
+        "impedance": "impedance",
+        "signal_type": "signal-type",
+        "system_tx_loss": "system-tx-loss",
+        "system_rx_loss": "system.rx-loss",
+        "tx_gain_2db": "tx-gain-2db",
+        "rx_gain_2db": "rx-gain-2db",
+        "nfpa_timer": "nfpa-timer",
+        "nfpa_timer_trig": ("nfpa-timer-trig", is_true),
+    }
+)
+
+
+# ModemInterface fields and their paths relative to an EthIntf object in a reply.
+MODEM_INTERFACE_FIELDS = field_spec(
+    {
+        "name": "name",
+        "admin": "admin",
+        "role": "role",
+        "description": "desc",
+        "rstp_act": "rstp-act",
+        "rstp_priority": "rstp-prio",
+        "rstp_path_cost": "rstp-path-cost",
+        "rstp_edge": ("rstp-edge", is_true),
+        "policy_map": "policy-map",
+        "mtu": "mtu",
+        "exp_eth": "exp-eth",
+        "native_vlan": "native-vlan",
+        "split_hor": ("split-hor", is_true),
+        "bpdu_mac": "bpdu-mac",
+        "lacp_tunnel": ("lacp-tunnel", is_true),
+        "trusted": ("trusted", is_true),
+        "bpdu_guard": ("bpdu-guard", is_true),
+        "igmp_immed_leave": "igmp-immed-leave",
+        "sec_profile_name": "sec.id.ethsecprof.@name",
+        "sec_profile_text": "sec.id.ethsecprof.#text",
+        "pbit_name": "pbit-map.id.dscpmap.@name",
+        "pbit_text": "pbit-map.id.dscpmap.#text",
+        "subscriber_id": "subscr-id",
+        "iqa_mode": "iqa-mode",
+        "iqa_poll_interval_seconds": "iqa-poll-interval-sec",
+        "iqa_errors_per_million_threshold": "iqa-err-per-million-thresh",
+        "iqa_poll_window": "iqa-poll-window",
+        "iqa_interval_count_alarm_threshold": "iqa-interval-cnt-alm-thresh",
+        "iqa_minimum_frame_count": "iqa-min-frame-cnt",
+        "force_dot1x": "force-dot1x",
+        "source_mac_limit": "src-mac-limit",
+    }
+)
+
+
+# ModemPort fields and their paths relative to a DslPort object in a reply.
+MODEM_PORT_FIELDS = field_spec(
+    {
+        "admin": "admin",
+        "description": "desc",
+        "dsl_port_gos": "gos.id.dslportgos",
+        "ethernet_port_gos": "eth-gos.id.ethportgos",
+        "service_type": "svc-type",
+        "path_l": "path-l",
+        "fb_vpi": "fb-vpi",
+        "fb_vci": "fb-vci",
+        "vsdl_prof": "vdsl-prof",
+        "rpt_events": ("rpt-events", is_true),
+        "power_save": ("power-save", is_true),
+        "power_down_timeout": "power-down-timeout",
+        "dmn": "dmn",
+        "dmx": "dmx",
+        "umn": "umn",
+        "umx": "umx",
+        "dmni": "dmni",
+        "umni": "umni",
+        "dimxl": "dimxl",
+        "uimxl": "uimxl",
+        "dmns": "dmns",
+        "dmxs": "dmxs",
+        "dts": "dts",
+        "umns": "umns",
+        "umxs": "umxs",
+        "uts": "uts",
+        "po": "po",
+        "drm": "drm",
+        "urm": "urm",
+        "ddam": "ddam",
+        "duam": "duam",
+        "udam": "udam",
+        "uuam": "uuam",
+        "ddat": "ddat",
+        "duat": "duat",
+        "udat": "udat",
+        "uuat": "uuat",
+        "dei": "dei",
+        "uei": "uei",
+        "ahc": ("ahc", is_true),
+        "dgmne": "dgmne",
+        "usmne": "usmne",
+        "dgmxn": "dgmxn",
+        "usmxn": "usmxn",
+        "dgmxd": "dgmxd",
+        "ugmxd": "ugmxd",
+        "dgmns": "dgmns",
+        "ugmns": "ugmns",
+        "dgsr": "dgsr",
+        "ugsr": "ugsr",
+        "dgmnr": "dgmnr",
+        "usmnr": "usmnr",
+        "gdir": "gdir",
+        "usir": "usir",
+        "m": "m",
+        "u1a": "u1a",
+        "u1b": "u1b",
+        "u2a": "u2a",
+        "u2b": "u2b",
+        "u3a": "u3a",
+        "u3b": "u3b",
+        "u4a": "u4a",
+        "u4b": "u4b",
+        "ukl0": "ukl0",
+        "d1i": "d1i",
+        "d1v": "d1v",
+        "d2i": "d2i",
+        "d2v": "d2v",
+        "d3i": "d3i",
+        "d3v": "d3v",
+        "d4i": "d4i",
+        "d4v": "d4v",
+        "d5i": "d5i",
+        "d5v": "d5v",
+        "d6i": "d6i",
+        "d6v": "d6v",
+        "d7i": "d7i",
+        "d7v": "d7v",
+        "d8i": "d8i",
+        "d8v": "d8v",
+        "d9i": "d9i",
+        "d9v": "d9v",
+        "d10i": "d10i",
+        "d10v": "d10v",
+        "d11i": "d11i",
+        "d11v": "d11v",
+        "d12i": "d12i",
+        "d12v": "d12v",
+        "d13i": "d13i",
+        "d13v": "d13v",
+        "d14i": "d14i",
+        "d14v": "d14v",
+        "d15i": "d15i",
+        "d15v": "d15v",
+        "d16i": "d16i",
+        "d16v": "d16v",
+        "desel": "desel",
+        "descma": "descma",
+        "descmb": "descmb",
+        "descmc": "descmc",
+        "dmus": "dmus",
+        "dfmin": "dfmin",
+        "dfmax": "dfmax",
+        "r1a": "r1a",
+        "r1b": "r1b",
+        "r2a": "r2a",
+        "r2b": "r2b",
+        "r3a": "r3a",
+        "r3b": "r3b",
+        "r4a": "r4a",
+        "r4b": "r4b",
+        "r5a": "r5a",
+        "r5b": "r5b",
+        "r6a": "r6a",
+        "r6b": "r6b",
+        "r7a": "r7a",
+        "r7b": "r7b",
+        "r8a": "r8a",
+        "r8b": "r8b",
+        "r9a": "r9a",
+        "r9b": "r9b",
+        "r10a": "r10a",
+        "r10b": "r10b",
+        "r11a": "r11a",
+        "r11b": "r11b",
+        "r12a": "r12a",
+        "r12b": "r12b",
+        "r13a": "r13a",
+        "r13b": "r13b",
+        "r14a": "r14a",
+        "r14b": "r14b",
+        "r15a": "r15a",
+        "r15b": "r15b",
+        "r16a": "r16a",
+        "r16b": "r16b",
+        "g1a": "g1a",
+        "g1b": "g1b",
+        "g2a": "g2a",
+        "g2b": "g2b",
+        "g3a": "g3a",
+        "g3b": "g3b",
+        "g4a": "g4a",
+        "g4b": "g4b",
+        "downstream_vectoring": "ds-vectoring",
+        "upstream_vectoring": "us-vectoring",
+        "vectoring_group": "vectoring-group",
+        "join_vectoring_group": ("join-vectoring-grp", is_true),
+    }
+)
+
+
+# ModemStatus fields and their paths relative to a DslPort status object in a reply.
+MODEM_STATUS_FIELDS = field_spec(
+    {
+        "operational_status": "op-stat",
+        "derived_states": "derived-states",
+        "operation": "op",
+        "mode": "mode",
+        "active_profile": "act",
+        "last_retrain_status": "init",
+        "data_mode": "data-mode",
+        "uptime": "op-time",
+        "atm_header_compression": "ahc",
+        "retrain_count": "retrain-count",
+        "last_applied_template": "last-templ",
+        "act_vec_mode": "act-vec-mode",
+        "vec_state": "vec-state",
+        "power_save_timer": "power-save-timer",
+        "act_psd_mask": "act-psd-mask",
+        "upstream_rate": "us-rate",
+        "upstream_delay": "us-delay",
+        "upstream_inp": "us-inp",
+        "upstream_snrm": "us-snrm",
+        "upstream_la": "us-la",
+        "upstream_attainable_rate": "us-att-rate",
+        "upstream_atp": "us-atp",
+        "upstream_atmptm": "us-atmptm",
+        "upstream_enh_inp": "us-enh-inp",
+        "upstream_rtx_etr": "us-rtx-etr",
+        "upstream_rtx_inp_shine": "us-rtx-inp-shine",
+        "upstream_rtx_inp_rein": "us-rtx-inp-rein",
+        "upstream_rtx_delay": "us-rtx-delay",
+        "downstream_rate": "ds-rate",
+        "downstream_delay": "ds-delay",
+        "downstream_inp": "ds-inp",
+        "downstream_snrm": "ds-snrm",
+        "downstream_la": "ds-atten",
+        "downstream_attainable_rate": "ds-att-rate",
+        "downstream_atp": "ds-atp",
+        "downstream_atmptm": "ds-atmptm",
+        "downstream_enh_inp": "ds-enh-inp",
+        "downstream_rtx_etr": "ds-rtx-etr",
+        "downstream_rtx_inp_shine": "ds-rtx-inp-shine",
+        "downstream_rtx_inp_rein": "ds-rtx-inp-rein",
+        "downstream_rtx_delay": "ds-rtx-delay",
+    }
+)
+
+# ModemStatus field each status attribute is read into.
+MODEM_STATUS_ATTR_FIELDS = {path[0]: name for name, path, _ in MODEM_STATUS_FIELDS}
+
+
+def xdsl_status_attrs(fields: frozenset[str]) -> str:
+    """
+    Narrows the attributes GET_XDSL_STATUS asks for down to the ones behind some ModemStatus fields.
+    :param fields: ModemStatus field names. Ex: frozenset({"upstream_rate", "downstream_rate"})
+    :return: The space separated attr-list.
+    :raises: ValueError if fields is empty or names a field that is not in the status reply.
+    """
+    attrs = [
+        attr
+        for attr in payloads.XDSL_STATUS_ATTRS.split()
+        if MODEM_STATUS_ATTR_FIELDS.get(attr) in fields
+    ]
+    unknown = set(fields) - {MODEM_STATUS_ATTR_FIELDS[attr] for attr in attrs}
+    if not fields or unknown:
+        raise ValueError(
+            f"Unknown ModemStatus fields: {sorted(unknown) or 'none given'}"
+        )
+    return " ".join(attrs)
+
+
+# ModemPerformance fields and their names in the performance counters of a show-dsl-pm reply.
+MODEM_PERFORMANCE_FIELDS = field_spec(
+    {
+        "code_violations": "cv-c",
+        "code_violations_far_end": "cv-cfe",
+        "forward_error_correction": "fec-c",
+        "forward_error_correction_far_end": "fec-cfe",
+        "forward_error_correction_seconds": "fec-l",
+        "forward_error_correction_seconds_far_end": "fec-lfe",
+        "errored_seconds": "es-l",
+        "errored_seconds_far_end": "es-lfe",
+        "severely_errored_seconds": "ses-l",
+        "severely_errored_seconds_far_end": "ses-lfe",
+        "loss_of_signal_seconds": "loss-l",
+        "loss_of_signal_seconds_far_end": "loss-lfe",
+        "unavailable_seconds": "uas-l",
+        "unavailable_seconds_far_end": "uas-lfe",
+        "full_initialization_count": "init-l",
+        "failed_full_initialization_count": "linit-l",
+        "ptm_tc_crc_error_count": "crc-p",
+        "ptm_tc_code_violation_count": "cv-p",
+    }
+)
+
+
+# XDSLLineTest fields and their paths relative to the action-reply of a line test.
+XDSL_LINE_TEST_FIELDS = field_spec(
+    {
+        "execution_status": "execution-status",
+        "result_summary": "result-summary",
+        "hazard_potential": "hazard-potential",
+        "foreign_emf": "foreign-emf",
+        "resistive_faults": "resistive-faults",
+        "receiver_off_hook": "receiver-off-hook",
+        "ringer": "ringer",
+        "tip_ground_dc_volt": "tip-ground-dc-volt",
+        "ring_ground_dc_volt": "ring-ground-dc-volt",
+        "tip_ground_ac_volt": "tip-ground-ac-volt",
+        "ring_ground_ac_volt": "ring-ground-ac-volt",
+        "tip_ground_dc_ohm": "tip-ground-dc-ohm",
+        "ring_ground_dc_ohm": "ring-ground-dc-ohm",
+        "ringer_equivalent": "ringer-equiv",
+        "tip_ground_cap": "tip-ground-cap",
+        "ring_ground_cap": "ring-ground-cap",
+        "tip_ring_cap": "tip-ring-cap",
+    }
+)
+
+
+# Elements each method reads from its reply, the rest of the reply is not parsed.
+ONT_GENERAL_SELECT = select_paths(
+    field_paths(DATA_OBJECT, ONT_GENERAL_FIELDS) + [DATA_OBJECT + ONT_ID]
+)
+ONT_STATUS_SELECT = select_paths(
+    field_paths(ONT_STATUS_CONFIG_PATH, ONT_GENERAL_FIELDS)
+    + field_paths(ONT_STATUS_OBJECT_PATH, ONT_STATUS_FIELDS)
+)
+COUNTERS_SELECT = select_paths(
+    [ACTION_REPLY + COUNTER_TYPES, ACTION_REPLY + COUNTER_VALUES]
+)
+ONT_PORT_SELECT = select_paths(field_paths(DATA_OBJECT, ONT_PORT_FIELDS))
+ONT_SERVICE_SELECT = select_paths(field_paths(DATA_OBJECT_CHILD, ONT_SERVICE_FIELDS))
+ONT_VOICE_SELECT = select_paths(field_paths(DATA_OBJECT, ONT_VOICE_FIELDS))
+ONT_LIST_SELECT = select_paths([DATA_OBJECT_CHILD + ONT_ID])
+MODEM_INTERFACE_SELECT = select_paths(field_paths(DATA_OBJECT, MODEM_INTERFACE_FIELDS))
+MODEM_PORT_SELECT = select_paths(field_paths(DATA_OBJECT, MODEM_PORT_FIELDS))
+MODEM_STATUS_SELECT = select_paths(field_paths(DATA_OBJECT, MODEM_STATUS_FIELDS))
+MODEM_STATUSES_SELECT = select_paths(
+    field_paths(DATA_OBJECT, MODEM_STATUS_FIELDS) + [DATA_OBJECT + DSL_PORT_ID]
+)
+XDSL_LINE_TEST_SELECT = select_paths(field_paths(ACTION_REPLY, XDSL_LINE_TEST_FIELDS))
+NODE_ALARMS_SELECT = select_paths([ACTION_REPLY_ALARMS])
+
+
+class CmsAdapter(HTTPAdapter):
+    """
+    HTTPAdapter for connections to the CMS. Besides urllib3's TCP_NODELAY its sockets send TCP keepalives, so pooled
+    connections left idle between requests are kept open through firewalls and dead ones are noticed.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        ]
+        return super().init_poolmanager(*args, **kwargs)
 
 
 class CmsClient:
     def __init__(self):
         self.netconf_url = self.generate_netconf_url(CMS_IP)
         self.session_id = None
+        self._http = requests.Session()
+        self._http.headers.update(
+            {
+                "Content-Type": "text/xml;charset=ISO8859-1",
+                "User-Agent": f"CMS_NBI_CONNECT-{CMS_USERNAME}",
+            }
+        )
+        self._http.mount(
+            "http://",
+            CmsAdapter(
+                pool_connections=1,
+                pool_maxsize=POOL_SIZE,
+                max_retries=Retry(total=CONNECT_RETRIES, read=0, backoff_factor=0.1),
+            ),
+        )
+        self._config_cache: OrderedDict[tuple, tuple[object, float]] = OrderedDict()
+        self._status_cache: OrderedDict[tuple, tuple[object, float]] = OrderedDict()
+        self._cache_lock = threading.RLock()
 
     # --- Authentication ---
     def login(self, username=CMS_USERNAME, password=CMS_PASSWORD) -> str:
         """
         Sends a login to request to the CMS server. Uses the ip, username, and password from the environment variables
-        CMS_IP, CMS_USERNAME, and CMS_PASSWORD.
+        CMS_IP, CMS_USERNAME, and CMS_PASSWORD. A session id obtained by another CmsClient with the same credentials is
+        reused instead if it is younger than SESSION_TTL seconds.
         :return: A CMS session ID used to authenticate additional requests.
         :raises: CmsCommunicationFailure if it is unable to reach the CMS server.
         :raises: CmsAuthenticationFailure if the CMS server denies the authentication process.
         """
+        # Reuse a cached session if it has not expired
+        cache_key = (self.netconf_url, username, password)
+        with _SESSION_LOCK:
+            cached = _SESSION_CACHE.get(cache_key)
+            if cached is not None and time.monotonic() - cached[1] < SESSION_TTL:
+                _SESSION_CACHE[cache_key] = (cached[0], time.monotonic(), cached[2])
+                cached[2].add(self)
+                self.session_id = cached[0]
+                return self.session_id
+
         # Send login request
-        payload = f"""
-            <?xml version="1.0" encoding="UTF-8"?>
-            <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
-            <soapenv:Body>
-            <auth message-id="{self.message_id}">
-                <login>
-                    <UserName>{username}</UserName>
-                    <Password>{password}</Password>
-                </login>
-            </auth>
-            </soapenv:Body>
-            </soapenv:Envelope>"""
+        payload = self._render(payloads.LOGIN, username=username, password=password)
         resp, _ = self.__post(payload)
 
         if resp == {}:
             raise CmsCommunicationFailure(self.netconf_url)
 
-        code = get(resp, "Envelope.Body.auth-reply.ResultCode")
-        session_id = get(resp, "Envelope.Body.auth-reply.SessionId")
+        reply = get_path(resp, AUTH_REPLY)
+        code = get_path(reply, AUTH_RESULT_CODE)
+        session_id = get_path(reply, AUTH_SESSION_ID)
 
         if session_id is None or code != "0":
             raise CmsAuthenticationFailure(CMS_USERNAME, CMS_IP)
 
-        # Return valid session id
+        # Cache and return valid session id
+        with _SESSION_LOCK:
+            _SESSION_CACHE[cache_key] = (
+                session_id,
+                time.monotonic(),
+                weakref.WeakSet([self]),
+            )
         self.session_id = session_id
         return session_id
 
     def logout(self) -> None:
         """
         Sends a logout request to the CMS server using the session id from the login request and the CMS server ip from
-        the environment variable CMS_IP.
+        the environment variable CMS_IP. If other clients still share the session it is only released by this client,
+        the CMS is not told to end it.
         :return: None
         :raises: CmsCommunicationFailure if it is unable to reach the CMS server.
         :raises: CmsDeauthenticationFailure if the server rejects the logout request.
         """
+        # Stop sharing the session with other clients, leave it open if any are still using it
+        with _SESSION_LOCK:
+            for key, (session_id, _, holders) in list(_SESSION_CACHE.items()):
+                if session_id != self.session_id:
+                    continue
+                holders.discard(self)
+                if holders:
+                    self.session_id = None
+                    return
+                del _SESSION_CACHE[key]
+
         # Send logout request
-        payload = f"""
-            <?xml version="1.0" encoding="UTF-8"?>
-            <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
-            <soapenv:Body>
-            <auth message-id="{self.message_id}">
-                <logout>
-                    <UserName>{CMS_USERNAME}</UserName>
-                    <SessionId>{self.session_id}</SessionId>
-                </logout>
-            </auth>
-            </soapenv:Body>
-            </soapenv:Envelope>"""
+        payload = self._render(payloads.LOGOUT)
         resp, _ = self.__post(payload)
 
         if resp == {}:
             raise CmsCommunicationFailure(self.netconf_url)
 
         # Verify logout success
-        code = get(resp, "Envelope.Body.auth-reply.ResultCode")
+        reply = get_path(resp, AUTH_REPLY)
+        code = get_path(reply, AUTH_RESULT_CODE)
 
         if code != "0":
             raise CmsDeauthenticationFailure(CMS_USERNAME, CMS_IP)
 
+    def close(self) -> None:
+        """
+        Closes the pooled connections to the CMS server, they are reopened if the client is used again.
+        :return: None
+        """
+        self._http.close()
+
     # ----- Fiber -----
     def get_ont(self, node_id: str, ont_id: str) -> OntGeneral:
         """
@@ -115,2309 +956,903 @@ class CmsClient:
         :param ont_id: The ont's id. Ex: 18331
         :return: OntGeneral
         """
-        # Send soap request for ont info to cms server
-        payload = f"""
-            <soapenv:Envelope xmlns:soapenv="www.w3.org/2003/05/soap-envelope">
-            <soapenv:Body>
-            <rpc message-id="{self.message_id}" nodename="NTWK-{node_id}" username="{CMS_USERNAME}" sessionid="{self.session_id}">
-                <get-config>
-                    <source>
-                        <running/>
-                    </source>
-                    <filter type="subtree">
-                        <top>
-                            <object>
-                            <type>Ont</type>
-                            <id>
-                                <ont>{ont_id}</ont>
-                            </id>
-                            </object>
-                        </top>
-                    </filter>
-                </get-config>
-            </rpc>
-            </soapenv:Body>
-            </soapenv:Envelope>"""
+        cache_key = (str(node_id), str(ont_id), None)
+        cached = self._cached(self._config_cache, cache_key, CONFIG_TTL)
+        if cached is not None:
+            return cached
+
+        onts = self.get_onts(node_id, [ont_id])
+        if not onts:
+            return OntGeneral(
+                parent_node=node_id,
+                id=ont_id,
+                **build_fields(None, ONT_GENERAL_FIELDS),
+            )
 
-        resp, _ = self.__post(payload)
+        self._cache(self._config_cache, cache_key, onts[0], CONFIG_CACHE_SIZE)
+        return onts[0]
 
-        # Extract information
-        ont_info = OntGeneral(
-            parent_node=node_id,
-            id=ont_id,
-            admin_state=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.admin"
-            ),
-            model_nr=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ontprof.id.ontprof.@name",
-            ),
-            serial_nr=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.serno"
-            ),
-            registration_id=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.reg-id"
-            ),
-            subscriber_id=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.subscr-id",
-            ),
-            description=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.descr"
-            ),
-            vendor=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.vendor"
-            ),
-            shelf=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.linked-pon.id.shelf",
-            ),
-            card=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.linked-pon.id.card",
-            ),
-            port=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.linked-pon.id.gponport",
-            ),
-            pwe3prof=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.pwe3prof"
-            ),
-            low_rx_opt_pwr_ne_thresh=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.low-rx-opt-pwr-ne-thresh",
-            ),
-            high_rx_opt_pwr_ne_thresh=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.high-rx-opt-pwr-ne-thresh",
-            ),
-            us_sdber_rate=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.us-sdber-rate",
-            ),
-            low_rx_opt_pwr_fe_thresh=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.low-rx-opt-pwr-fe-thresh",
-            ),
-            high_rx_opt_pwr_fe_thresh=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.high-rx-opt-pwr-fe-thresh",
-            ),
-            low_tx_opt_pwr_thresh=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.low-tx-opt-pwr-thresh",
-            ),
-            high_tx_opt_pwr_thresh=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.high-tx-opt-pwr-thresh",
-            ),
-            low_laser_bias_thresh=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.low-laser-bias-thresh",
-            ),
-            high_laser_bias_thresh=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.high-laser-bias-thresh",
-            ),
-            low_line_pwr_feed_thresh=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.low-line-pwr-feed-thresh",
-            ),
-            high_line_pwr_feed_thresh=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.high-line-pwr-feed-thresh",
-            ),
-            low_ont_temp_thresh=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.low-ont-temp-thresh",
-            ),
-            high_ont_temp_thresh=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.high-ont-temp-thresh",
-            ),
-            battery_present=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.serno"
-            )
-            == "true",
-            pse_max_power_budget=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.pse-max-power-budget",
-            ),
-            poe_class_control=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.poe-class-control",
-            ),
-            ont_port_color=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ont-port-color",
+    def get_onts(self, node_id: str, ont_ids: list[str]) -> list[OntGeneral]:
+        """
+        Retrieves information about several onts on the same node using a single request.
+        :param node_id: CMS node id excluding NTWK-. Ex: rsvt-pon-1.
+        :param ont_ids: The onts' ids. Ex: [18331, 18332]
+        :return: list[OntGeneral], one for each ont found on the node.
+        """
+        # An empty filter would select the node's whole configuration
+        if not ont_ids:
+            return []
+
+        # Send soap request for info on every ont to cms server
+        payload = self._render(
+            payloads.GET_ONTS,
+            node_id=node_id,
+            ont_filters="".join(
+                payloads.ONT_FILTER.format(ont_id=ont_id) for ont_id in ont_ids
             ),
         )
 
-        return ont_info
+        resp, _ = self.__post(
+            payload, select=ONT_GENERAL_SELECT, force_list=frozenset({"object"})
+        )
+
+        objects = get_path(resp, DATA_OBJECT, default=[])
+
+        # Extract information
+        return [
+            OntGeneral(
+                parent_node=node_id,
+                id=get_path(obj, ONT_ID),
+                **build_fields(obj, ONT_GENERAL_FIELDS),
+            )
+            for obj in objects
+        ]
 
     def get_ont_status(self, node_id, ont_id) -> OntStatus:
+        cache_key = ("ont_status", str(node_id), str(ont_id))
+        cached = self._cached(self._status_cache, cache_key, STATUS_TTL)
+        if cached is not None:
+            return cached
+
         # Send soap request for ont realtime info to cms server
-        payload = f"""
-            <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
-            <soapenv:Body>
-            <rpc message-id="{self.message_id}" nodename="NTWK-{node_id}" username="{CMS_USERNAME}" sessionid="{self.session_id}">
-                <action>
-                    <action-type>show-ont</action-type>
-                    <action-args>
-                        <ont>
-                            <type>Ont</type>
-                            <id><ont>{ont_id}</ont></id>
-                        </ont>
-                    </action-args>
-                </action>
-            </rpc>
-            </soapenv:Body>
-            </soapenv:Envelope>"""
+        payload = self._render(payloads.GET_ONT_STATUS, node_id=node_id, ont_id=ont_id)
 
-        resp, _ = self.__post(payload)
+        resp, _ = self.__post(payload, select=ONT_STATUS_SELECT)
 
-        return OntStatus(
+        # Extract information
+        config = get_path(resp, ONT_STATUS_CONFIG_PATH)
+        status = get_path(resp, ONT_STATUS_OBJECT_PATH)
+
+        ont_status = OntStatus(
             parent_node=node_id,
             id=ont_id,
-            admin_state=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.admin",
-            ),
-            model_nr=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.ontprof.id.ontprof.@name",
-            ),
-            serial_nr=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.serno",
-            ),
-            registration_id=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.reg-id",
-            ),
-            subscriber_id=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.subscr-id",
-            ),
-            description=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.descr",
-            ),
-            vendor=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.vendor",
-            ),
-            shelf=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.linked-pon.id.shelf",
-            ),
-            card=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.linked-pon.id.card",
-            ),
-            port=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.linked-pon.id.gponport",
-            ),
-            pwe3prof=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.pwe3prof",
-            ),
-            low_rx_opt_pwr_ne_thresh=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.low-rx-opt-pwr-ne-thresh",
-            ),
-            high_rx_opt_pwr_ne_thresh=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.high-rx-opt-pwr-ne-thresh",
-            ),
-            us_sdber_rate=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.us-sdber-rate",
-            ),
-            low_rx_opt_pwr_fe_thresh=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.low-rx-opt-pwr-fe-thresh",
-            ),
-            high_rx_opt_pwr_fe_thresh=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.high-rx-opt-pwr-fe-thresh",
-            ),
-            low_tx_opt_pwr_thresh=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.low-tx-opt-pwr-thresh",
-            ),
-            high_tx_opt_pwr_thresh=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.high-tx-opt-pwr-thresh",
-            ),
-            low_laser_bias_thresh=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.low-laser-bias-thresh",
-            ),
-            high_laser_bias_thresh=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.high-laser-bias-thresh",
-            ),
-            low_line_pwr_feed_thresh=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.low-line-pwr-feed-thresh",
-            ),
-            high_line_pwr_feed_thresh=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.high-line-pwr-feed-thresh",
-            ),
-            low_ont_temp_thresh=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.low-ont-temp-thresh",
-            ),
-            high_ont_temp_thresh=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.high-ont-temp-thresh",
-            ),
-            battery_present=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.serno",
-            )
-            == "true",
-            pse_max_power_budget=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.pse-max-power-budget",
-            ),
-            poe_class_control=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.poe-class-control",
-            ),
-            ont_port_color=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get-config.object.ont-port-color",
-            ),
-            operational_status=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.op-stat",
-            ),
-            critical_alarm_count=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.crit",
-            ),
-            major_alarm_count=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.maj",
-            ),
-            minor_alarm_count=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.min",
-            ),
-            warning_alarm_count=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.warn",
-            ),
-            info_alarm_count=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.info",
-            ),
-            derived_states=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.derived-states",
-            ),
-            clei=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.clei",
-            ),
-            product_code=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.product-code",
-            ),
-            mfg_serial_number=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.mfg-serno",
-            ),
-            uptime=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.uptime",
-            ),
-            rx_opt_signal_level=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.opt-sig-lvl",
-            ),
-            tx_opt_signal_level=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.tx-opt-lvl",
-            ),
-            loop_length=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.range-length",
-            ),
-            fe_opt_signal_level=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.fe-opt-lvl",
-            ),
-            ds_sdber_rate=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.cur-ds-sdber-rate",
-            ),
-            current_software_version=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.curr-sw-vers",
-            ),
-            alternate_software_version=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.alt-sw-vers",
-            ),
-            current_committed="true"
-            == get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.curr-cust-vers",
-            ),
-            rg_config_file_version=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.rg-file-vers",
-            ),
-            voip_config_file_version=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.voip-file-vers",
-            ),
-            current_customer_version=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.curr-cust-vers",
-            ),
-            alternate_customer_version=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.alt-cust-vers",
-            ),
-            onu_mac_address=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.onu-mac",
-            ),
-            mta_mac_address=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.mta-mac",
-            ),
-            response_time=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.response-time",
-            ),
-            pse_available_power_budget=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.pse-available-power-budget",
-            ),
-            pse_aggregate_output_power=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.pse-aggregate-output-power",
-            ),
-            pse_management_capability=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.pse-mgmt-capb",
-            ),
-            option=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.match.get.object.option",
-            ),
+            **build_fields(config, ONT_GENERAL_FIELDS),
+            **build_fields(status, ONT_STATUS_FIELDS),
         )
 
+        # Only cache onts that were found
+        if config or status:
+            self._cache(self._status_cache, cache_key, ont_status, STATUS_CACHE_SIZE)
+        return ont_status
+
     def get_ont_performance(self, node_id: str, ont_id: str) -> OntPerformance:
+        cache_key = ("ont_performance", str(node_id), str(ont_id))
+        cached = self._cached(self._status_cache, cache_key, STATUS_TTL)
+        if cached is not None:
+            return cached
+
         # Send soap request for ont bip errors to cms server
-        payload = f"""
-            <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
-            <soapenv:Body>
-            <rpc message-id="{self.message_id}" nodename="NTWK-{node_id}" username="{CMS_USERNAME}" sessionid="{self.session_id}">
-                <action>
-                    <action-type>show-ont-pm</action-type>
-                    <action-args>
-                        <object>
-                            <type>Ont</type>
-                            <id>
-                                <ont>{ont_id}</ont>
-                            </id>
-                        </object>
-                        <bin-type>1-day</bin-type>
-                        <start-bin>1</start-bin>
-                        <count>1</count>
-                    </action-args>
-                </action>
-            </rpc>
-            </soapenv:Body>
-            </soapenv:Envelope>"""
+        payload = self._render(
+            payloads.GET_ONT_PERFORMANCE, node_id=node_id, ont_id=ont_id
+        )
 
-        resp, _ = self.__post(payload)
+        resp, _ = self.__post(payload, select=COUNTERS_SELECT)
 
         # Extract information
         bip_errors = {}
-        error_types = get(
-            resp, "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.types"
-        )
-        error_values = get(
-            resp, "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.bin.val"
-        )
+        counters = get_path(resp, ACTION_REPLY)
+        error_types = get_path(counters, COUNTER_TYPES)
+        error_values = get_path(counters, COUNTER_VALUES)
         if isinstance(error_types, str) and isinstance(error_values, str):
-            bip_errors = dict(zip(error_types.split(" "), error_values.split(" ")))
+            bip_errors = dict(zip(error_types.split(), error_values.split()))
 
-        return OntPerformance(
+        performance = OntPerformance(
             parent_node=node_id,
             id=ont_id,
-            bip_errors_up=get(bip_errors, "bip-err-up"),
-            bip_errors_down=get(bip_errors, "bip-err-down"),
-            bip_errored_seconds_up=get(bip_errors, "bip-err-sec-up"),
-            bip_errored_seconds_down=get(bip_errors, "bip-err-sec-down"),
-            bip_severely_errored_seconds_up=get(bip_errors, "bip-sev-err-sec-up"),
-            bip_severely_errored_seconds_down=get(bip_errors, "bip-sev-err-sec-down"),
-            bip_unavailable_seconds_up=get(bip_errors, "bip-unavail-sec-up"),
-            bip_unavailable_seconds_down=get(bip_errors, "bip-unavail-sec-down"),
-            missed_bursts_up=get(bip_errors, "miss-burst-up"),
-            missed_bursts_seconds=get(bip_errors, "missed-burst-sec"),
-            gem_hec_errors_up=get(bip_errors, "gem-hec-err-up"),
+            **build_fields(bip_errors, ONT_PERFORMANCE_FIELDS),
         )
 
+        # Only cache onts that were found
+        if bip_errors:
+            self._cache(self._status_cache, cache_key, performance, STATUS_CACHE_SIZE)
+        return performance
+
     def get_ont_port(self, node_id: str, ont_id: str, port_nr: int) -> OntPort:
+        cache_key = (str(node_id), str(ont_id), str(port_nr))
+        cached = self._cached(self._config_cache, cache_key, CONFIG_TTL)
+        if cached is not None:
+            return cached
+
         # Send soap request for ont info to cms server
-        payload = f"""
-            <soapenv:Envelope xmlns:soapenv="www.w3.org/2003/05/soap-envelope">
-            <soapenv:Body>
-            <rpc message-id="{self.message_id}" nodename="NTWK-{node_id}" username="{CMS_USERNAME}" sessionid="{self.session_id}">
-                <get-config>
-                    <source>
-                        <running/>
-                    </source>
-                    <filter type="subtree">
-                        <top>
-                            <object>
-                            <type>OntEthGe</type>
-                            <id>
-                                <ont>{ont_id}</ont>
-                                <ontslot>3</ontslot>
-                                <ontethge>{port_nr}</ontethge>
-                            </id>
-                            </object>
-                        </top>
-                    </filter>
-                </get-config>
-            </rpc>
-            </soapenv:Body>
-            </soapenv:Envelope>"""
+        payload = self._render(
+            payloads.GET_ONT_PORT, node_id=node_id, ont_id=ont_id, port_nr=port_nr
+        )
 
-        resp, _ = self.__post(payload)
+        resp, _ = self.__post(payload, select=ONT_PORT_SELECT)
+        obj = get_path(resp, DATA_OBJECT)
 
-        return OntPort(
+        port = OntPort(
             parent_node=node_id,
             id=ont_id,
-            slot=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.id.ontslot",
-            ),
-            port_number=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.id.ontethge",
-            ),
-            admin=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.admin"
-            ),
-            subscriber_id=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.subscr-id",
-            ),
-            description=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.descr"
-            ),
-            speed=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.speed"
-            ),
-            duplex=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.duplex"
-            ),
-            disable_on_battery=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.disable-on-batt",
-            )
-            == "true",
-            link_oam_events=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.link-oam-events",
-            )
-            == "true",
-            accept_link_oam_loopbacks=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.accept-link-oam-loopbacks",
-            )
-            == "true",
-            intf=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.intf"
-            ),
-            dhcp_limit_override=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.dhcp-limit-override",
-            ),
-            downstream_bandwidth_profile=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ds-bw-prof",
-            ),
-            force_dot1x=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.force-dot1x",
-            ),
-            role=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.role"
-            ),
-            policing=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.policing"
-            ),
-            poe_power_priority=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.poe-power-priority",
-            ),
-            poe_class_control=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.poe-class-control",
-            ),
-            voice_policy_profile=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.voice-policy-profile",
-            ),
-            ppte_power_control=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ppte-power-control",
-            )
-            == "false",
-            ont_port_color=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ont-port-color",
-            ),
+            **build_fields(obj, ONT_PORT_FIELDS),
         )
 
+        # Only cache ports that were found
+        if obj:
+            self._cache(self._config_cache, cache_key, port, CONFIG_CACHE_SIZE)
+        return port
+
     def get_ont_port_data_service(
         self, node_id: str, ont_id: str, port_nr: int
     ) -> OntService:
+        cache_key = (str(node_id), str(ont_id), str(port_nr), "data_service")
+        cached = self._cached(self._config_cache, cache_key, CONFIG_TTL)
+        if cached is not None:
+            return cached
+
         # Send soap request for ont info to cms server
-        payload = f"""
-                    <soapenv:Envelope xmlns:soapenv="www.w3.org/2003/05/soap-envelope">
-                    <soapenv:Body>
-                    <rpc message-id="{self.message_id}" nodename="NTWK-{node_id}" username="{CMS_USERNAME}" sessionid="{self.session_id}">
-                        <get-config>
-                            <source>
-                                <running/>
-                            </source>
-                            <filter type="subtree">
-                                <top>
-                                    <object>
-                                    <type>OntEthGe</type>
-                                    <id>
-                                        <ont>{ont_id}</ont>
-                                        <ontslot>3</ontslot>
-                                        <ontethge>{port_nr}</ontethge>
-                                    </id>
-                                    <children>
-                                        <type>EthSvc</type>
-                                        <attr-list>admin descr tag-action bw-prof out-tag in-tag mcast-prof pon-cos us-cir-override us-pir-override ds-pir-override hot-swap pppoe-force-discard</attr-list>
-                                    </children>
-                                    </object>
-                                </top>
-                            </filter>
-                        </get-config>
-                    </rpc>
-                    </soapenv:Body>
-                    </soapenv:Envelope>"""
+        payload = self._render(
+            payloads.GET_ONT_PORT_DATA_SERVICE,
+            node_id=node_id,
+            ont_id=ont_id,
+            port_nr=port_nr,
+        )
 
-        resp, _ = self.__post(payload)
+        resp, _ = self.__post(payload, select=ONT_SERVICE_SELECT)
+        service = get_path(resp, DATA_OBJECT_CHILD)
 
-        return OntService(
+        ont_service = OntService(
             parent_node=node_id,
             id=ont_id,
             port_number=port_nr,
-            admin=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.children.child.admin",
-            ),
-            description=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.children.child.descr",
-            ),
-            service_name=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.children.child.id.ethsvc.@name",
-            ),
-            service_text=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.children.child.id.ethsvc.#text",
-            ),
-            bandwidth_name=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.children.child.bw-prof.id.bwprof.@name",
-            ),
-            bandwidth_text=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.children.child.bw-prof.id.bwprof.#text",
-            ),
-            bandwidth_id=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.children.child.bw-prof.id.bwprof.@localId",
-            ),
-            out_tag=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.children.child.out-tag",
-            ),
-            in_tag=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.children.child.in-tag",
-            ),
-            mcast_profile=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.children.child.mcast-prof",
-            ),
-            pon_cos=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.children.child.pon-cos",
-            ),
-            upstream_cir_override=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.children.child.us-cir-override",
-            ),
-            upstream_pir_override=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.children.child.us-pir-override",
-            ),
-            downstream_pir_override=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.children.child.ds-pir-override",
-            ),
-            hot_swap=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.children.child.hot-swap",
-            )
-            == "true",
-            pppoe_force_discard=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.children.child.pppoe-force-discard",
-            )
-            == "true",
+            **build_fields(service, ONT_SERVICE_FIELDS),
         )
 
+        # Only cache services that were found
+        if service:
+            self._cache(self._config_cache, cache_key, ont_service, CONFIG_CACHE_SIZE)
+        return ont_service
+
     def get_ont_voice_service(
         self, node_id: str, ont_id: str, port_nr: int
     ) -> OntVoice:
+        cache_key = (str(node_id), str(ont_id), str(port_nr), "voice_service")
+        cached = self._cached(self._config_cache, cache_key, CONFIG_TTL)
+        if cached is not None:
+            return cached
+
         # Send soap request for ont info to cms server
-        payload = f"""
-                    <soapenv:Envelope xmlns:soapenv="www.w3.org/2003/05/soap-envelope">
-                    <soapenv:Body>
-                    <rpc message-id="{self.message_id}" nodename="NTWK-{node_id}" username="{CMS_USERNAME}" sessionid="{self.session_id}">
-                        <get-config>
-                            <source>
-                                <running/>
-                            </source>
-                            <filter type="subtree">
-                                <top>
-                                    <object>
-                                    <type>OntPots</type>
-                                    <id>
-                                        <ont>{ont_id}</ont>
-                                        <ontslot>6</ontslot>
-                                        <ontpots>{port_nr}</ontpots>
-                                    </id>
-                                    </object>
-                                </top>
-                            </filter>
-                        </get-config>
-                    </rpc>
-                    </soapenv:Body>
-                    </soapenv:Envelope>"""
+        payload = self._render(
+            payloads.GET_ONT_VOICE_SERVICE,
+            node_id=node_id,
+            ont_id=ont_id,
+            port_nr=port_nr,
+        )
 
-        resp, _ = self.__post(payload)
+        resp, _ = self.__post(payload, select=ONT_VOICE_SELECT)
+        obj = get_path(resp, DATA_OBJECT)
 
-        return OntVoice(
+        voice = OntVoice(
             parent_node=node_id,
             id=ont_id,
             port_number=port_nr,
-            admin=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.admin"
-            ),
-            subscriber_id=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.subscr-id",
-            ),
-            description=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.descr"
-            ),
-            impedance=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.impedance",
-            ),
-            signal_type=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.signal-type",
-            ),
-            system_tx_loss=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.system-tx-loss",
-            ),
-            system_rx_loss=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.system.rx-loss",
-            ),
-            tx_gain_2db=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.tx-gain-2db",
-            ),
-            rx_gain_2db=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.rx-gain-2db",
-            ),
-            nfpa_timer=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.nfpa-timer",
-            ),
-            nfpa_timer_trig=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.nfpa-timer-trig",
-            )
-            == "true",
+            **build_fields(obj, ONT_VOICE_FIELDS),
         )
 
+        # Only cache services that were found
+        if obj:
+            self._cache(self._config_cache, cache_key, voice, CONFIG_CACHE_SIZE)
+        return voice
+
     def list_onts_on_gpon(
         self, node_id: str, shelf_nr: int, card_nr: int, gpon_nr: int
     ) -> OntList:
-        payload = f"""
-            <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
-            <soapenv:Body>
-            <rpc message-id="{self.message_id}" nodename="NTWK-{node_id}" username="{CMS_USERNAME}" sessionid="{self.session_id}">
-                <get-config>
-                    <source>
-                        <running/>
-                    </source>
-                    <filter type="subtree">
-                        <top>
-                            <object>
-                                <type>System</type>
-                                <id/>
-                                <children>
-                                    <type>Ont</type>
-                                    <attr-filter>
-                                        <linked-pon>
-                                            <type>GponPort</type>
-                                            <id>
-                                                <shelf>{shelf_nr}</shelf>
-                                                <card>{card_nr}</card>
-                                                <gponport>{gpon_nr}</gponport>
-                                            </id>
-                                        </linked-pon>
-                                    </attr-filter>
-                                </children>
-                            </object>
-                        </top>
-                    </filter>
-                </get-config>
-            </rpc>
-            </soapenv:Body>
-            </soapenv:Envelope>"""
+        payload = self._render(
+            payloads.LIST_ONTS_ON_GPON,
+            node_id=node_id,
+            shelf_nr=shelf_nr,
+            card_nr=card_nr,
+            gpon_nr=gpon_nr,
+        )
 
-        resp, _ = self.__post(payload)
+        resp, _ = self.__post(
+            payload, select=ONT_LIST_SELECT, force_list=frozenset({"child"})
+        )
 
         # Check if successful
-        if (
-            get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.children"
-            )
-            is None
-        ):
+        if get_path(resp, DATA_OBJECT_CHILDREN) is None:
             return OntList(onts=[], count=-1)
 
-        children = get(
-            resp,
-            "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.children.child",
-        )
-        if not isinstance(children, list):
-            children = [children]
+        children = get_path(resp, DATA_OBJECT_CHILD, default=[])
 
-        ont_ids = []
-        for child in children:
-            if get(child, "id.ont") is not None:
-                ont_ids.append(get(child, "id.ont"))
+        ont_ids = [
+            ont_id
+            for ont_id in (get_path(child, ONT_ID) for child in children)
+            if ont_id is not None
+        ]
 
         return OntList(onts=ont_ids, count=len(ont_ids))
 
     def reset_ont_performance(self, node_id: str, ont_id: str) -> bool:
         # Send soap request for ont bip errors to cms server
-        payload = f"""
-            <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
-            <soapenv:Body>
-            <rpc message-id="{self.message_id}" nodename="NTWK-{node_id}" username="{CMS_USERNAME}" sessionid="{self.session_id}">
-                <action>
-                    <action-type>clear-ont-pm</action-type>
-                    <action-args>
-                        <object>
-                            <type>Ont</type>
-                            <id>
-                                <ont>{ont_id}</ont>
-                            </id>
-                        </object>
-                        <bin-type>1-day</bin-type>
-                        <start-bin>1</start-bin>
-                        <count>8</count>
-                    </action-args>
-                </action>
-            </rpc>
-            </soapenv:Body>
-            </soapenv:Envelope>"""
+        payload = self._render(
+            payloads.RESET_ONT_PERFORMANCE, node_id=node_id, ont_id=ont_id
+        )
 
         resp, _ = self.__post(payload)
+        self.invalidate(node_id, ont_id)
 
         # Extract success code
-        if isinstance(get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply"), dict):
-            return "ok" in get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply")
-
-        return False
+        return self._was_ok(resp)
 
     def reset_ont(self, node_id: str, ont_id: str, force=True) -> bool:
         # Send request to reset ont
-        payload = f"""
-            <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
-            <soapenv:Body>
-            <rpc message-id="{self.message_id}" nodename="NTWK-{node_id}" username="{CMS_USERNAME}" sessionid="{self.session_id}">
-                <action>
-                    <action-type>
-                        reset-ont
-                    </action-type>
-                    <action-args>
-                        <object>
-                            <type>Ont</type>
-                            <id>
-                                <ont>{ont_id}</ont>
-                            </id>
-                        </object>
-                        <force>{'true' if force else 'false'}</force>
-                    </action-args>
-                </action>
-            </rpc>
-            </soapenv:Body>
-            </soapenv:Envelope>"""
+        payload = self._render(
+            payloads.RESET_ONT,
+            node_id=node_id,
+            ont_id=ont_id,
+            force="true" if force else "false",
+        )
 
         resp, _ = self.__post(payload)
+        self.invalidate(node_id, ont_id)
 
         # Extract success code
-        if isinstance(get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply"), dict):
-            return "ok" in get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply")
-
-        return False
+        return self._was_ok(resp)
 
     def quarantine_ont(self, node_id: str, ont_serial_nr: str) -> bool:
         # Send request to add ont on node with serial number to quarantine pool
-        payload = f"""
-            <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
-            <soapenv:Body>
-                <rpc message-id="{self.message_id}" nodename="NTWK-{node_id}" username="{CMS_USERNAME}" sessionid="{self.session_id}">
-                <edit-config>
-                    <target>
-                        <running/>
-                    </target>
-                    <config>
-                        <top>
-                            <object get-config="true" operation="create">
-                                <type>QuarOnt</type>
-                                <id>
-                                    <quaront>CXNK{ont_serial_nr}</quaront>
-                                </id>
-                            </object>
-                        </top>
-                    </config>
-                </edit-config>
-            </rpc>
-            </soapenv:Body>
-            </soapenv:Envelope>"""
+        payload = self._render(
+            payloads.QUARANTINE_ONT, node_id=node_id, ont_serial_nr=ont_serial_nr
+        )
 
         resp, _ = self.__post(payload)
 
         # Extract success code
-        if isinstance(get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply"), dict):
-            return "ok" in get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply")
-
-        return False
+        return self._was_ok(resp)
 
     def release_ont(self, node_id: str, ont_serial_nr: str) -> bool:
         # Send request to cms to add ont to quarantine pool
-        payload = f"""
-            <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
-            <soapenv:Body>
-                <rpc message-id="{self.message_id}" nodename="NTWK-{node_id}" username="{CMS_USERNAME}" sessionid="{self.session_id}">
-                <edit-config>
-                    <target>
-                        <running/>
-                    </target>
-                    <config>
-                        <top>
-                            <object operation="delete">
-                                <type>QuarOnt</type>
-                                <id>
-                                    <quaront>CXNK{ont_serial_nr}</quaront>
-                                </id>
-                            </object>
-                        </top>
-                    </config>
-                </edit-config>
-            </rpc>
-            </soapenv:Body>
-            </soapenv:Envelope>"""
+        payload = self._render(
+            payloads.RELEASE_ONT, node_id=node_id, ont_serial_nr=ont_serial_nr
+        )
 
         resp, _ = self.__post(payload)
 
         # Extract success code
-        if isinstance(get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply"), dict):
-            return "ok" in get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply")
-
-        return False
+        return self._was_ok(resp)
 
     def disable_ont(self, node_id: str, ont_id: str) -> bool:
         # Send soap request to cms to disable ont
-        payload = f"""
-            <soapenv:Envelope xmlns:soapenv="www.w3.org/2003/05/soap-envelope">
-            <soapenv:Body>
-            <rpc message-id="{self.message_id}" nodename="NTWK-{node_id}" username="{CMS_USERNAME}" sessionid="{self.session_id}">
-                <edit-config>
-                    <target>
-                        <running/>
-                    </target>
-                    <config>
-                        <top>
-                            <object operation="merge">
-                                <type>Ont</type>
-                                <id>
-                                    <ont>{ont_id}</ont>
-                                </id>
-                                <admin>disabled</admin>
-                            </object>
-                        </top>
-                    </config>
-                </edit-config>
-            </rpc>
-            </soapenv:Body>
-            </soapenv:Envelope>"""
+        payload = self._render(payloads.DISABLE_ONT, node_id=node_id, ont_id=ont_id)
 
         resp, _ = self.__post(payload)
+        self.invalidate(node_id, ont_id)
 
         # Extract success code
-        if isinstance(get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply"), dict):
-            return "ok" in get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply")
-
-        return False
+        return self._was_ok(resp)
 
     def disable_ont_port(self, node_id: str, ont_id, port_nr: str) -> bool:
-        payload = f"""
-            <soapenv:Envelope xmlns:soapenv="www.w3.org/2003/05/soap-envelope">
-            <soapenv:Body>
-            <rpc message-id="{self.message_id}" nodename="NTWK-{node_id}" username="{CMS_USERNAME}" sessionid="{self.session_id}">
-                <edit-config>
-                    <target>
-                        <running/>
-                    </target>
-                    <config>
-                        <top>
-                            <object operation="merge">
-                                <type>OntEthGe</type>
-                                <id>
-                                    <ont>{ont_id}</ont>
-                                    <ontslot>3</ontslot>
-                                    <ontethge>{port_nr}</ontethge>
-                                </id>
-                                <admin>disabled</admin>
-                            </object>
-                        </top>
-                    </config>
-                </edit-config>
-            </rpc>
-            </soapenv:Body>
-            </soapenv:Envelope>"""
+        payload = self._render(
+            payloads.DISABLE_ONT_PORT, node_id=node_id, ont_id=ont_id, port_nr=port_nr
+        )
 
         resp, _ = self.__post(payload)
+        self.invalidate(node_id, ont_id)
 
         # Extract success code
-        if isinstance(get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply"), dict):
-            return "ok" in get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply")
-
-        return False
+        return self._was_ok(resp)
 
     def enable_ont(self, node_id: str, ont_id: str) -> bool:
         # Send soap request to cms to disable ont
-        payload = f"""
-            <soapenv:Envelope xmlns:soapenv="www.w3.org/2003/05/soap-envelope">
-            <soapenv:Body>
-            <rpc message-id="{self.message_id}" nodename="NTWK-{node_id}" username="{CMS_USERNAME}" sessionid="{self.session_id}">
-                <edit-config>
-                    <target>
-                        <running/>
-                    </target>
-                    <config>
-                        <top>
-                            <object operation="merge">
-                                <type>Ont</type>
-                                <id>
-                                    <ont>{ont_id}</ont>
-                                </id>
-                                <admin>enabled</admin>
-                            </object>
-                        </top>
-                    </config>
-                </edit-config>
-            </rpc>
-            </soapenv:Body>
-            </soapenv:Envelope>"""
+        payload = self._render(payloads.ENABLE_ONT, node_id=node_id, ont_id=ont_id)
 
         resp, _ = self.__post(payload)
+        self.invalidate(node_id, ont_id)
 
         # Extract success code
-        if isinstance(get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply"), dict):
-            return "ok" in get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply")
-
-        return False
+        return self._was_ok(resp)
 
     def enable_ont_port(self, node_id: str, ont_id: str, port_nr: str) -> bool:
         # Send soap request to cms to enable on port.
-        payload = f"""
-            <soapenv:Envelope xmlns:soapenv="www.w3.org/2003/05/soap-envelope">
-            <soapenv:Body>
-            <rpc message-id="{self.message_id}" nodename="NTWK-{node_id}" username="{CMS_USERNAME}" sessionid="{self.session_id}">
-                <edit-config>
-                    <target>
-                        <running/>
-                    </target>
-                    <config>
-                        <top>
-                            <object operation="merge">
-                                <type>OntEthGe</type>
-                                <id>
-                                    <ont>{ont_id}</ont>
-                                    <ontslot>3</ontslot>
-                                    <ontethge>{port_nr}</ontethge>
-                                </id>
-                                <admin>enabled</admin>
-                            </object>
-                        </top>
-                    </config>
-                </edit-config>
-            </rpc>
-            </soapenv:Body>
-            </soapenv:Envelope>"""
+        payload = self._render(
+            payloads.ENABLE_ONT_PORT, node_id=node_id, ont_id=ont_id, port_nr=port_nr
+        )
 
         resp, _ = self.__post(payload)
+        self.invalidate(node_id, ont_id)
 
         # Extract success code
-        if isinstance(get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply"), dict):
-            return "ok" in get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply")
+        return self._was_ok(resp)
 
-        return False
+    def invalidate(self, node_id: str, ont_id: str) -> None:
+        """
+        Drops the cached configuration, status and bip errors of an ont and its ports, call after changing it.
+        :param node_id: CMS node id excluding NTWK-. Ex: rsvt-pon-1.
+        :param ont_id: The ont's id. Ex: 18331
+        :return: None
+        """
+        with self._cache_lock:
+            for key in [
+                k for k in self._config_cache if k[:2] == (str(node_id), str(ont_id))
+            ]:
+                del self._config_cache[key]
+            self._status_cache.pop(("ont_status", str(node_id), str(ont_id)), None)
+            self._status_cache.pop(("ont_performance", str(node_id), str(ont_id)), None)
 
     # ------ DSL ------
     def get_xdsl_interface(
         self, node_id: str, shelf_nr: int, card_nr: int, interface_id: int
     ) -> ModemInterface:
         # Send soap request for ont info to cms server
-        payload = f"""
-            <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
-            <soapenv:Body>
-            <rpc message-id="{self.message_id}" nodename="NTWK-{node_id}" username="{CMS_USERNAME}" sessionid="{self.session_id}">
-                <get-config>
-                    <source>
-                        <running/>
-                    </source>
-                    <filter type="subtree">
-                        <top>
-                            <object>
-                                <type>EthIntf</type>
-                                <id>
-                                    <shelf>{shelf_nr}</shelf>
-                                    <card>{card_nr}</card>
-                                    <ethintf>{interface_id + 200}</ethintf>
-                                </id>
-                            </object>
-                        </top>
-                    </filter>
-                </get-config>
-            </rpc>
-            </soapenv:Body>
-            </soapenv:Envelope>"""
+        payload = self._render(
+            payloads.GET_XDSL_INTERFACE,
+            node_id=node_id,
+            shelf_nr=shelf_nr,
+            card_nr=card_nr,
+            ethintf=interface_id + 200,
+        )
 
-        resp, _ = self.__post(payload)
+        resp, _ = self.__post(payload, select=MODEM_INTERFACE_SELECT)
+        obj = get_path(resp, DATA_OBJECT)
 
         return ModemInterface(
             parent_node=node_id,
             shelf=shelf_nr,
             card=card_nr,
             interface=interface_id,
-            name=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.name"
-            ),
-            admin=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.admin"
-            ),
-            role=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.role"
-            ),
-            description=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.desc"
-            ),
-            rstp_act=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.rstp-act"
-            ),
-            rstp_priority=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.rstp-prio",
-            ),
-            rstp_path_cost=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.rstp-path-cost",
-            ),
-            rstp_edge=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.rstp-edge",
-            )
-            == "true",
-            policy_map=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.policy-map",
-            ),
-            mtu=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.mtu"
-            ),
-            exp_eth=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.exp-eth"
-            ),
-            native_vlan=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.native-vlan",
-            ),
-            split_hor=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.split-hor",
-            )
-            == "true",
-            bpdu_mac=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.bpdu-mac"
-            ),
-            lacp_tunnel=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.lacp-tunnel",
-            )
-            == "true",
-            trusted=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.trusted"
-            )
-            == "true",
-            bpdu_guard=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.bpdu-guard",
-            )
-            == "true",
-            igmp_immed_leave=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.igmp-immed-leave",
-            ),
-            sec_profile_name=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.sec.id.ethsecprof.@name",
-            ),
-            sec_profile_text=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.sec.id.ethsecprof.#text",
-            ),
-            pbit_name=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.pbit-map.id.dscpmap.@name",
-            ),
-            pbit_text=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.pbit-map.id.dscpmap.#text",
-            ),
-            subscriber_id=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.subscr-id",
-            ),
-            iqa_mode=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.iqa-mode"
-            ),
-            iqa_poll_interval_seconds=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.iqa-poll-interval-sec",
-            ),
-            iqa_errors_per_million_threshold=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.iqa-err-per-million-thresh",
-            ),
-            iqa_poll_window=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.iqa-poll-window",
-            ),
-            iqa_interval_count_alarm_threshold=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.iqa-interval-cnt-alm-thresh",
-            ),
-            iqa_minimum_frame_count=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.iqa-min-frame-cnt",
-            ),
-            force_dot1x=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.force-dot1x",
-            ),
-            source_mac_limit=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.src-mac-limit",
-            ),
+            **build_fields(obj, MODEM_INTERFACE_FIELDS),
         )
 
     def get_xdsl_port(
         self, node_id: str, shelf_nr: int, card_nr: int, interface_id: int
     ) -> ModemPort:
         # Send soap request for ont info to cms server
-        payload = f"""
-            <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
-            <soapenv:Body>
-            <rpc message-id="{self.message_id}" nodename="NTWK-{node_id}" username="{CMS_USERNAME}" sessionid="{self.session_id}">
-                <get-config>
-                    <source>
-                        <running/>
-                    </source>
-                    <filter type="subtree">
-                        <top>
-                            <object>
-                                <type>DslPort</type>
-                                <id>
-                                    <shelf>{shelf_nr}</shelf>
-                                    <card>{card_nr}</card>
-                                    <dslport>{interface_id}</dslport>
-                                </id>
-                            </object>
-                        </top>
-                    </filter>
-                </get-config>
-            </rpc>
-            </soapenv:Body>
-            </soapenv:Envelope>"""
+        payload = self._render(
+            payloads.GET_XDSL_PORT,
+            node_id=node_id,
+            shelf_nr=shelf_nr,
+            card_nr=card_nr,
+            interface_id=interface_id,
+        )
 
-        resp, _ = self.__post(payload)
+        resp, _ = self.__post(payload, select=MODEM_PORT_SELECT)
+        obj = get_path(resp, DATA_OBJECT)
 
         return ModemPort(
             parent_node=node_id,
             shelf=shelf_nr,
             card=card_nr,
             interface=interface_id,
-            admin=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.admin"
-            ),
-            description=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.desc"
-            ),
-            dsl_port_gos=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.gos.id.dslportgos",
-            ),
-            ethernet_port_gos=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.eth-gos.id.ethportgos",
-            ),
-            service_type=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.svc-type"
-            ),
-            path_l=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.path-l"
-            ),
-            fb_vpi=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.fb-vpi"
-            ),
-            fb_vci=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.fb-vci"
-            ),
-            vsdl_prof=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.vdsl-prof",
-            ),
-            rpt_events=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.rpt-events",
-            )
-            == "true",
-            power_save=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.power-save",
-            )
-            == "true",
-            power_down_timeout=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.power-down-timeout",
-            ),
-            dmn=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.dmn"
-            ),
-            dmx=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.dmx"
-            ),
-            umn=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.umn"
-            ),
-            umx=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.umx"
-            ),
-            dmni=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.dmni"
-            ),
-            umni=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.umni"
-            ),
-            dimxl=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.dimxl"
-            ),
-            uimxl=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.uimxl"
-            ),
-            dmns=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.dmns"
-            ),
-            dmxs=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.dmxs"
-            ),
-            dts=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.dts"
-            ),
-            umns=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.umns"
-            ),
-            umxs=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.umxs"
-            ),
-            uts=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.uts"
-            ),
-            po=get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.po"),
-            drm=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.drm"
-            ),
-            urm=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.urm"
-            ),
-            ddam=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ddam"
-            ),
-            duam=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.duam"
-            ),
-            udam=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.udam"
-            ),
-            uuam=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.uuam"
-            ),
-            ddat=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ddat"
-            ),
-            duat=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.duat"
-            ),
-            udat=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.udat"
-            ),
-            uuat=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.uuat"
-            ),
-            dei=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.dei"
-            ),
-            uei=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.uei"
-            ),
-            ahc=get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ahc")
-            == "true",
-            dgmne=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.dgmne"
-            ),
-            usmne=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.usmne"
-            ),
-            dgmxn=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.dgmxn"
-            ),
-            usmxn=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.usmxn"
-            ),
-            dgmxd=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.dgmxd"
-            ),
-            ugmxd=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ugmxd"
-            ),
-            dgmns=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.dgmns"
-            ),
-            ugmns=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ugmns"
-            ),
-            dgsr=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.dgsr"
-            ),
-            ugsr=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ugsr"
-            ),
-            dgmnr=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.dgmnr"
-            ),
-            usmnr=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.usmnr"
-            ),
-            gdir=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.gdir"
-            ),
-            usir=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.usir"
-            ),
-            m=get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.m"),
-            u1a=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.u1a"
-            ),
-            u1b=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.u1b"
-            ),
-            u2a=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.u2a"
-            ),
-            u2b=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.u2b"
-            ),
-            u3a=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.u3a"
-            ),
-            u3b=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.u3b"
-            ),
-            u4a=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.u4a"
-            ),
-            u4b=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.u4b"
-            ),
-            ukl0=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ukl0"
-            ),
-            d1i=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d1i"
-            ),
-            d1v=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d1v"
-            ),
-            d2i=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d2i"
-            ),
-            d2v=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d2v"
-            ),
-            d3i=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d3i"
-            ),
-            d3v=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d3v"
-            ),
-            d4i=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d4i"
-            ),
-            d4v=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d4v"
-            ),
-            d5i=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d5i"
-            ),
-            d5v=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d5v"
-            ),
-            d6i=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d6i"
-            ),
-            d6v=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d6v"
-            ),
-            d7i=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d7i"
-            ),
-            d7v=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d7v"
-            ),
-            d8i=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d8i"
-            ),
-            d8v=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d8v"
-            ),
-            d9i=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d9i"
-            ),
-            d9v=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d9v"
-            ),
-            d10i=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d10i"
-            ),
-            d10v=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d10v"
-            ),
-            d11i=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d11i"
-            ),
-            d11v=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d11v"
-            ),
-            d12i=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d12i"
-            ),
-            d12v=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d12v"
-            ),
-            d13i=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d13i"
-            ),
-            d13v=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d13v"
-            ),
-            d14i=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d14i"
-            ),
-            d14v=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d14v"
-            ),
-            d15i=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d15i"
-            ),
-            d15v=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d15v"
-            ),
-            d16i=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d16i"
-            ),
-            d16v=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.d16v"
-            ),
-            desel=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.desel"
-            ),
-            descma=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.descma"
-            ),
-            descmb=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.descmb"
-            ),
-            descmc=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.descmc"
-            ),
-            dmus=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.dmus"
-            ),
-            dfmin=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.dfmin"
-            ),
-            dfmax=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.dfmax"
-            ),
-            r1a=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r1a"
-            ),
-            r1b=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r1b"
-            ),
-            r2a=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r2a"
-            ),
-            r2b=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r2b"
-            ),
-            r3a=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r3a"
-            ),
-            r3b=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r3b"
-            ),
-            r4a=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r4a"
-            ),
-            r4b=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r4b"
-            ),
-            r5a=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r5a"
-            ),
-            r5b=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r5b"
-            ),
-            r6a=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r6a"
-            ),
-            r6b=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r6b"
-            ),
-            r7a=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r7a"
-            ),
-            r7b=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r7b"
-            ),
-            r8a=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r8a"
-            ),
-            r8b=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r8b"
-            ),
-            r9a=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r9a"
-            ),
-            r9b=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r9b"
-            ),
-            r10a=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r10a"
-            ),
-            r10b=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r10b"
-            ),
-            r11a=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r11a"
-            ),
-            r11b=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r11b"
-            ),
-            r12a=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r12a"
-            ),
-            r12b=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r12b"
-            ),
-            r13a=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r13a"
-            ),
-            r13b=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r13b"
-            ),
-            r14a=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r14a"
-            ),
-            r14b=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r14b"
-            ),
-            r15a=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r15a"
-            ),
-            r15b=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r15b"
-            ),
-            r16a=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r16a"
-            ),
-            r16b=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.r16b"
-            ),
-            g1a=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.g1a"
-            ),
-            g1b=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.g1b"
-            ),
-            g2a=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.g2a"
-            ),
-            g2b=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.g2b"
-            ),
-            g3a=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.g3a"
-            ),
-            g3b=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.g3b"
-            ),
-            g4a=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.g4a"
-            ),
-            g4b=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.g4b"
-            ),
-            downstream_vectoring=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ds-vectoring",
-            ),
-            upstream_vectoring=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.us-vectoring",
-            ),
-            vectoring_group=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.vectoring-group",
-            ),
-            join_vectoring_group=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.join-vectoring-grp",
-            )
-            == "true",
+            **build_fields(obj, MODEM_PORT_FIELDS),
         )
 
     def get_xdsl_status(
-        self, node_id: str, shelf_nr: int, card_nr: int, interface_id: int
+        self,
+        node_id: str,
+        shelf_nr: int,
+        card_nr: int,
+        interface_id: int,
+        fields: frozenset[str] = None,
     ) -> ModemStatus:
+        # Only ask the CMS for the attributes behind the requested fields, the rest are left None
+        attr_list = payloads.XDSL_STATUS_ATTRS
+        if fields is not None:
+            attr_list = xdsl_status_attrs(fields)
+
+        cache_key = (
+            "status",
+            str(node_id),
+            str(shelf_nr),
+            str(card_nr),
+            str(interface_id),
+            None if fields is None else frozenset(fields),
+        )
+        cached = self._cached(self._status_cache, cache_key, STATUS_TTL)
+        if cached is not None:
+            return cached
+
         # Send soap request for ont info to cms server
-        payload = f"""
-                    <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
-                    <soapenv:Body>
-                    <rpc message-id="{self.message_id}" nodename="NTWK-{node_id}" username="{CMS_USERNAME}" sessionid="{self.session_id}">
-                        <get>
-                            <filter type="subtree">
-                                <top>
-                                    <object>
-                                        <type>DslPort</type>
-                                        <id>
-                                            <shelf>1</shelf>
-                                            <card>1</card>
-                                            <dslport>1</dslport>
-                                        </id>
-                                        <attr-list>op-stat derived-states op mode act init data-mode op-time ahc retrain-count last-templ act-vec-mode vec-state oper-status power-save-timer act-psd-mask us-rate us-delay us-inp us-snrm us-la us-att-rate us-atp us-atmptm us-enh-inp us-rtx-etr us-rtx-inp-shine us-rtx-inp-rein us-rtx-delay ds-rate ds-delay ds-inp ds-snrm ds-atten ds-att-rate ds-atp ds-atmptm ds-enh-inp ds-rtx-etr ds-rtx-inp-shine ds-rtx-inp-rein ds-rtx-delay </attr-list>
-                                    </object>
-                                </top>
-                            </filter>
-                        </get>
-                    </rpc>
-                    </soapenv:Body>
-                    </soapenv:Envelope>"""
+        payload = self._render(
+            payloads.GET_XDSL_STATUS,
+            node_id=node_id,
+            shelf_nr=shelf_nr,
+            card_nr=card_nr,
+            interface_id=interface_id,
+            attr_list=attr_list,
+        )
 
-        resp, _ = self.__post(payload)
+        resp, _ = self.__post(payload, select=MODEM_STATUS_SELECT)
+        obj = get_path(resp, DATA_OBJECT)
 
-        return ModemStatus(
+        status = ModemStatus(
             parent_node=node_id,
             shelf=shelf_nr,
             card=card_nr,
             interface=interface_id,
-            operational_status=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.op-stat"
-            ),
-            derived_states=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.derived-states",
-            ),
-            operation=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.op"
-            ),
-            mode=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.mode"
-            ),
-            active_profile=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.act"
-            ),
-            last_retrain_status=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.init"
-            ),
-            data_mode=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.data-mode",
-            ),
-            uptime=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.op-time"
-            ),
-            atm_header_compression=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ahc"
-            ),
-            retrain_count=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.retrain-count",
-            ),
-            last_applied_template=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.last-templ",
-            ),
-            act_vec_mode=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.act-vec-mode",
-            ),
-            vec_state=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.vec-state",
-            ),
-            power_save_timer=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.power-save-timer",
-            ),
-            act_psd_mask=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.act-psd-mask",
-            ),
-            upstream_rate=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.us-rate"
-            ),
-            upstream_delay=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.us-delay"
-            ),
-            upstream_inp=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.us-inp"
-            ),
-            upstream_snrm=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.us-snrm"
-            ),
-            upstream_la=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.us-la"
-            ),
-            upstream_attainable_rate=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.us-att-rate",
-            ),
-            upstream_atp=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.us-atp"
-            ),
-            upstream_atmptm=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.us-atmptm",
-            ),
-            upstream_enh_inp=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.us-enh-inp",
-            ),
-            upstream_rtx_etr=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.us-rtx-etr",
-            ),
-            upstream_rtx_inp_shine=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.us-rtx-inp-shine",
-            ),
-            upstream_rtx_inp_rein=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.us-rtx-inp-rein",
-            ),
-            upstream_rtx_delay=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.us-rtx-delay",
-            ),
-            downstream_rate=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ds-rate"
-            ),
-            downstream_delay=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ds-delay"
-            ),
-            downstream_inp=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ds-inp"
-            ),
-            downstream_snrm=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ds-snrm"
-            ),
-            downstream_la=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ds-la"
-            ),
-            downstream_attainable_rate=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ds-att-rate",
-            ),
-            downstream_atp=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ds-atp"
-            ),
-            downstream_atmptm=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ds-atmptm",
-            ),
-            downstream_enh_inp=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ds-enh-inp",
-            ),
-            downstream_rtx_etr=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ds-rtx-etr",
-            ),
-            downstream_rtx_inp_shine=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ds-rtx-inp-shine",
-            ),
-            downstream_rtx_inp_rein=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ds-rtx-inp-rein",
-            ),
-            downstream_rtx_delay=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.data.top.object.ds-rtx-delay",
+            **build_fields(obj, MODEM_STATUS_FIELDS),
+        )
+
+        # Only cache modems that were found
+        if obj:
+            self._cache(self._status_cache, cache_key, status, STATUS_CACHE_SIZE)
+        return status
+
+    def get_xdsl_statuses(
+        self, node_id: str, ports: list[tuple[int, int, int]]
+    ) -> list[ModemStatus]:
+        """
+        Retrieves the realtime status of several modems on the same node using a single request.
+        :param node_id: CMS node id excluding NTWK-. Ex: rsvt-pon-1.
+        :param ports: (shelf, card, interface) of every modem. Ex: [(1, 1, 1), (1, 1, 2)]
+        :return: list[ModemStatus], one for each modem found on the node.
+        """
+        # An empty filter would select the node's whole operational state
+        if not ports:
+            return []
+
+        # Send soap request for the status of every port to cms server
+        payload = self._render(
+            payloads.GET_XDSL_STATUSES,
+            node_id=node_id,
+            port_filters="".join(
+                payloads.XDSL_STATUS_FILTER.format(
+                    shelf_nr=shelf_nr,
+                    card_nr=card_nr,
+                    interface_id=interface_id,
+                    attr_list=payloads.XDSL_STATUS_ATTRS,
+                )
+                for shelf_nr, card_nr, interface_id in ports
             ),
         )
 
+        resp, _ = self.__post(
+            payload, select=MODEM_STATUSES_SELECT, force_list=frozenset({"object"})
+        )
+
+        objects = get_path(resp, DATA_OBJECT, default=[])
+
+        # Extract information
+        statuses = []
+        for obj in objects:
+            # An empty <id/> parses to None
+            port = get_path(obj, DSL_PORT_ID) or {}
+            statuses.append(
+                ModemStatus(
+                    parent_node=node_id,
+                    shelf=port.get("shelf"),
+                    card=port.get("card"),
+                    interface=port.get("dslport"),
+                    **build_fields(obj, MODEM_STATUS_FIELDS),
+                )
+            )
+        return statuses
+
     def get_xdsl_performance(
         self, node_id: str, shelf_nr: int, card_nr: int, interface_id: int
     ) -> ModemPerformance:
-        payload = f"""
-            <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
-            <soapenv:Body>
-            <rpc message-id="{self.message_id}" nodename="NTWK-{node_id}" username="{CMS_USERNAME}" sessionid="{self.session_id}">
-                <action>
-                    <action-type>show-dsl-pm</action-type>
-                    <action-args>
-                        <object>
-                            <type>DslPort</type>
-                            <id>
-                                <shelf>{shelf_nr}</shelf>
-                                <card>{card_nr}</card>
-                                <dslport>{interface_id}</dslport>
-                            </id>
-                        </object>
-                        <bin-type>1-day</bin-type>
-                        <start-bin>1</start-bin>
-                        <count>1</count>
-                    </action-args>
-                </action>
-            </rpc>
-            </soapenv:Body>
-            </soapenv:Envelope>"""
+        cache_key = (
+            "performance",
+            str(node_id),
+            str(shelf_nr),
+            str(card_nr),
+            str(interface_id),
+        )
+        cached = self._cached(self._status_cache, cache_key, STATUS_TTL)
+        if cached is not None:
+            return cached
+
+        payload = self._render(
+            payloads.GET_XDSL_PERFORMANCE,
+            node_id=node_id,
+            shelf_nr=shelf_nr,
+            card_nr=card_nr,
+            interface_id=interface_id,
+        )
 
-        resp, _ = self.__post(payload)
+        resp, _ = self.__post(payload, select=COUNTERS_SELECT)
 
         code_violations = {}
-        error_types = get(
-            resp, "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.types"
-        )
-        error_values = get(
-            resp, "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.bin.val"
-        )
+        counters = get_path(resp, ACTION_REPLY)
+        error_types = get_path(counters, COUNTER_TYPES)
+        error_values = get_path(counters, COUNTER_VALUES)
         if isinstance(error_types, str) and isinstance(error_values, str):
-            code_violations = dict(zip(error_types.split(" "), error_values.split(" ")))
+            code_violations = dict(zip(error_types.split(), error_values.split()))
 
-        return ModemPerformance(
+        performance = ModemPerformance(
             parent_node=node_id,
             shelf=shelf_nr,
             card=card_nr,
             interface=interface_id,
-            code_violations=get(code_violations, "cv-c"),
-            code_violations_far_end=get(code_violations, "cv-cfe"),
-            forward_error_correction=get(code_violations, "fec-c"),
-            forward_error_correction_far_end=get(code_violations, "fec-cfe"),
-            forward_error_correction_seconds=get(code_violations, "fec-l"),
-            forward_error_correction_seconds_far_end=get(code_violations, "fec-lfe"),
-            errored_seconds=get(code_violations, "es-l"),
-            errored_seconds_far_end=get(code_violations, "es-lfe"),
-            severely_errored_seconds=get(code_violations, "ses-l"),
-            severely_errored_seconds_far_end=get(code_violations, "ses-lfe"),
-            loss_of_signal_seconds=get(code_violations, "loss-l"),
-            loss_of_signal_seconds_far_end=get(code_violations, "loss-lfe"),
-            unavailable_seconds=get(code_violations, "uas-l"),
-            unavailable_seconds_far_end=get(code_violations, "uas-lfe"),
-            full_initialization_count=get(code_violations, "init-l"),
-            failed_full_initialization_count=get(code_violations, "linit-l"),
-            ptm_tc_crc_error_count=get(code_violations, "crc-p"),
-            ptm_tc_code_violation_count=get(code_violations, "cv-p"),
+            **build_fields(code_violations, MODEM_PERFORMANCE_FIELDS),
         )
 
+        # Only cache modems that were found
+        if code_violations:
+            self._cache(self._status_cache, cache_key, performance, STATUS_CACHE_SIZE)
+        return performance
+
     def run_xdsl_line_test(
         self, node_id: str, shelf_nr: int, card_nr: int, interface_id: int
     ) -> XDSLLineTest:
-        payload = f"""
-            <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
-            <soapenv:Body>
-            <rpc message-id="{self.message_id}" nodename="NTWK-{node_id}" username="{CMS_USERNAME}" sessionid="{self.session_id}">
-                <action>
-                    <action-type>test-pots-svc</action-type>
-                    <action-args>
-                        <pots>
-                            <type>Pots</type>
-                            <id>
-                                <shelf>{shelf_nr}</shelf>
-                                <card>{card_nr}</card>
-                                <pots>{interface_id}</pots>
-                            </id>
-                        </pots>
-                    </action-args>
-                </action>
-            </rpc>
-            </soapenv:Body>
-            </soapenv:Envelope>"""
-
-        resp, _ = self.__post(payload, timeout=30000)
-        print(json.dumps(resp, indent=2))
+        payload = self._render(
+            payloads.RUN_XDSL_LINE_TEST,
+            node_id=node_id,
+            shelf_nr=shelf_nr,
+            card_nr=card_nr,
+            interface_id=interface_id,
+        )
+
+        resp, _ = self.__post(payload, timeout=30000, select=XDSL_LINE_TEST_SELECT)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Line test reply: %s", json.dumps(resp, separators=(",", ":")))
+        line_test = get_path(resp, ACTION_REPLY)
 
         return XDSLLineTest(
             parent_node=node_id,
             shelf=shelf_nr,
             card=card_nr,
             interface=interface_id,
-            execution_status=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.execution-status",
-            ),
-            result_summary=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.result-summary",
-            ),
-            hazard_potential=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.hazard-potential",
-            ),
-            foreign_emf=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.foreign-emf"
-            ),
-            resistive_faults=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.resistive-faults",
-            ),
-            receiver_off_hook=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.receiver-off-hook",
-            ),
-            ringer=get(
-                resp, "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.ringer"
-            ),
-            tip_ground_dc_volt=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.tip-ground-dc-volt",
-            ),
-            ring_ground_dc_volt=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.ring-ground-dc-volt",
-            ),
-            tip_ground_ac_volt=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.tip-ground-ac-volt",
-            ),
-            ring_ground_ac_volt=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.ring-ground-ac-volt",
-            ),
-            tip_ground_dc_ohm=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.tip-ground-dc-ohm",
-            ),
-            ring_ground_dc_ohm=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.ring-ground-dc-ohm",
-            ),
-            ringer_equivalent=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.ringer-equiv",
-            ),
-            tip_ground_cap=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.tip-ground-cap",
-            ),
-            ring_ground_cap=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.ring-ground-cap",
-            ),
-            tip_ring_cap=get(
-                resp,
-                "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.tip-ring-cap",
-            ),
+            **build_fields(line_test, XDSL_LINE_TEST_FIELDS),
         )
 
     def disable_xdsl_port(
         self, node_id: str, shelf_nr: int, card_nr: int, interface_id: int
     ) -> bool:
         # Send soap request to cms to disable xdsl port
-        payload = f"""
-            <soapenv:Envelope xmlns:soapenv="www.w3.org/2003/05/soap-envelope">
-            <soapenv:Body>
-            <rpc message-id="{self.message_id}" nodename="NTWK-{node_id}" username="{CMS_USERNAME}" sessionid="{self.session_id}">
-                <edit-config>
-                    <target>
-                        <running/>
-                    </target>
-                    <config>
-                        <top>
-                            <object operation="merge">
-                                <type>DslPort</type>
-                                <id>
-                                    <shelf>{shelf_nr}</shelf>
-                                    <card>{card_nr}</card>
-                                    <dslport>{interface_id}</dslport>
-                                </id>
-                                <admin>disabled</admin>
-                            </object>
-                        </top>
-                    </config>
-                </edit-config>
-            </rpc>
-            </soapenv:Body>
-            </soapenv:Envelope>"""
+        payload = self._render(
+            payloads.DISABLE_XDSL_PORT,
+            node_id=node_id,
+            shelf_nr=shelf_nr,
+            card_nr=card_nr,
+            interface_id=interface_id,
+        )
 
         resp, _ = self.__post(payload)
+        self.invalidate_xdsl(node_id, shelf_nr, card_nr, interface_id)
 
         # Extract success code
-        if isinstance(get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply"), dict):
-            return "ok" in get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply")
-
-        return False
+        return self._was_ok(resp)
 
     def enable_xdsl_port(
         self, node_id: str, shelf_nr: int, card_nr: int, interface_id: int
     ) -> bool:
         # Send soap request to cms to enable xdsl port
-        payload = f"""
-            <soapenv:Envelope xmlns:soapenv="www.w3.org/2003/05/soap-envelope">
-            <soapenv:Body>
-            <rpc message-id="{self.message_id}" nodename="NTWK-{node_id}" username="{CMS_USERNAME}" sessionid="{self.session_id}">
-                <edit-config>
-                    <target>
-                        <running/>
-                    </target>
-                    <config>
-                        <top>
-                            <object operation="merge">
-                                <type>DslPort</type>
-                                <id>
-                                    <shelf>{shelf_nr}</shelf>
-                                    <card>{card_nr}</card>
-                                    <dslport>{interface_id}</dslport>
-                                </id>
-                                <admin>enabled-no-alarms</admin>
-                            </object>
-                        </top>
-                    </config>
-                </edit-config>
-            </rpc>
-            </soapenv:Body>
-            </soapenv:Envelope>"""
+        payload = self._render(
+            payloads.ENABLE_XDSL_PORT,
+            node_id=node_id,
+            shelf_nr=shelf_nr,
+            card_nr=card_nr,
+            interface_id=interface_id,
+        )
 
         resp, _ = self.__post(payload)
+        self.invalidate_xdsl(node_id, shelf_nr, card_nr, interface_id)
 
         # Extract success code
-        if isinstance(get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply"), dict):
-            return "ok" in get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply")
-
-        return False
+        return self._was_ok(resp)
 
     def enable_xdsl_bonding_group(
         self, node_id: str, shelf_nr: int, card_nr: int, interface_id: int
     ) -> bool:
         # Send soap request for ont info to cms server
-        payload = f"""
-            <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
-            <soapenv:Body>
-            <rpc message-id="{self.message_id}" nodename="NTWK-{node_id}" username="{CMS_USERNAME}" sessionid="{self.session_id}">
-                <edit-config>
-                    <target>
-                        <running/>
-                    </target>
-                    <config>
-                        <top>
-                            <object operation="merge">
-                                <type>DslBondIntf</type>
-                                <id>
-                                    <shelf>{shelf_nr}</shelf>
-                                    <card>{card_nr}</card>
-                                    <dslbondintf>{interface_id}</dslbondintf>
-                                </id>
-                                <admin>enabled-no-alarms</admin>
-                            </object>
-                        </top>
-                    </config>
-                </edit-config>
-            </rpc>
-            </soapenv:Body>
-            </soapenv:Envelope>"""
+        payload = self._render(
+            payloads.ENABLE_XDSL_BONDING_GROUP,
+            node_id=node_id,
+            shelf_nr=shelf_nr,
+            card_nr=card_nr,
+            interface_id=interface_id,
+        )
 
         resp, _ = self.__post(payload)
+        self.invalidate_xdsl(node_id, shelf_nr, card_nr, interface_id)
 
         # Extract success code
-        if isinstance(get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply"), dict):
-            return "ok" in get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply")
-
-        return False
+        return self._was_ok(resp)
 
     def disable_xdsl_bonding_group(
         self, node_id: str, shelf_nr: int, card_nr: int, interface_id: int
     ) -> bool:
         # Send soap request for ont info to cms server
-        payload = f"""
-            <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
-            <soapenv:Body>
-            <rpc message-id="{self.message_id}" nodename="NTWK-{node_id}" username="{CMS_USERNAME}" sessionid="{self.session_id}">
-                <edit-config>
-                    <target>
-                        <running/>
-                    </target>
-                    <config>
-                        <top>
-                            <object operation="merge">
-                                <type>DslBondIntf</type>
-                                <id>
-                                    <shelf>{shelf_nr}</shelf>
-                                    <card>{card_nr}</card>
-                                    <dslbondintf>{interface_id}</dslbondintf>
-                                </id>
-                                <admin>disabled</admin>
-                            </object>
-                        </top>
-                    </config>
-                </edit-config>
-            </rpc>
-            </soapenv:Body>
-            </soapenv:Envelope>"""
+        payload = self._render(
+            payloads.DISABLE_XDSL_BONDING_GROUP,
+            node_id=node_id,
+            shelf_nr=shelf_nr,
+            card_nr=card_nr,
+            interface_id=interface_id,
+        )
 
         resp, _ = self.__post(payload)
+        self.invalidate_xdsl(node_id, shelf_nr, card_nr, interface_id)
 
         # Extract success code
-        if isinstance(get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply"), dict):
-            return "ok" in get(resp, "soapenv:Envelope.soapenv:Body.rpc-reply")
+        return self._was_ok(resp)
 
-        return False
+    def invalidate_xdsl(
+        self, node_id: str, shelf_nr: int, card_nr: int, interface_id: int
+    ) -> None:
+        """
+        Drops the cached status and performance of a modem, call after changing it.
+        :param node_id: CMS node id excluding NTWK-. Ex: rsvt-pon-1.
+        :param shelf_nr: The modem's shelf. Ex: 1
+        :param card_nr: The modem's card. Ex: 1
+        :param interface_id: The modem's interface. Ex: 1
+        :return: None
+        """
+        port = (str(node_id), str(shelf_nr), str(card_nr), str(interface_id))
+        with self._cache_lock:
+            for key in [k for k in self._status_cache if k[1:5] == port]:
+                del self._status_cache[key]
 
     # ----- Node -----
     def get_node_alarms(self, node_id, _payload_after="<action-args/>") -> NodeAlarms:
-        payload = f"""
-            <soapenv:Envelope xmlns:soapenv=\"www.w3.org/2003/05/soap-envelope\">
-            <soapenv:Body>
-            <rpc message-id="{self.message_id}" nodename="NTWK-{node_id}" username="{CMS_USERNAME}" sessionid="{self.session_id}">
-                <action>
-                    <action-type>show-alarms</action-type>
-                    <action-args/>
-                </action>
-            </rpc>
-            </soapenv:Body>
-            </soapenv:Envelope>
+        return NodeAlarms(alarms=list(self.iter_node_alarms(node_id, _payload_after)))
+
+    def iter_node_alarms(self, node_id, _payload_after="<action-args/>"):
         """
+        Yields the active alarms of a node one at a time. The next page is only requested once the caller has consumed
+        the current one, so callers that stop early skip the remaining requests.
+        :param node_id: CMS node id excluding NTWK-. Ex: rsvt-pon-1.
+        :return: Iterator of alarm dicts as found in the show-alarms reply.
+        """
+        action_args = _payload_after
 
-        resp, more = self.__post(payload.replace("<action-args/>", _payload_after))
+        # Request pages of alarms until the CMS stops reporting more, each page starts after the last alarm received
+        while True:
+            payload = self._render(
+                payloads.GET_NODE_ALARMS, node_id=node_id, action_args=action_args
+            )
 
-        alarms = get(
-            resp,
-            "soapenv:Envelope.soapenv:Body.rpc-reply.action-reply.alarm",
-            default=[],
-        )
-        if isinstance(alarms, dict):
-            alarms = [alarms]
+            resp, more = self.__post(
+                payload, select=NODE_ALARMS_SELECT, force_list=frozenset({"alarm"})
+            )
 
-        if more:
-            object_type = f"<type>{alarms[-1]['object']['type']}</type>"
+            page = get_path(resp, ACTION_REPLY_ALARMS, default=[])
+            yield from page
+
+            if not more or not page:
+                return
+
+            object_type = f"<type>{page[-1]['object']['type']}</type>"
             object_id = ""
-            for key, value in alarms[-1]["object"]["id"].items():
+            for key, value in page[-1]["object"]["id"].items():
                 object_id += f"<{key}>{value}</{key}>"
-            last_alarm = f"<after-alarm>{alarms[-1]['alarm-type']}</after-alarm>"
-            payload_insertion = f"<action-args><start-instance>{object_type}<id>{object_id}</id></start-instance>{last_alarm}</action-args>"
+            last_alarm = f"<after-alarm>{page[-1]['alarm-type']}</after-alarm>"
+            action_args = f"<action-args><start-instance>{object_type}<id>{object_id}</id></start-instance>{last_alarm}</action-args>"
 
-            return NodeAlarms(
-                alarms=alarms
-                + self.get_node_alarms(node_id, _payload_after=payload_insertion).alarms
-            )
+    # ----- Utility -----
+    @staticmethod
+    def _was_ok(resp: dict) -> bool:
+        """
+        Checks whether an edit-config or action request was acknowledged with <ok/>.
+        :param resp: Parsed response.
+        :return: True if the rpc-reply contains ok.
+        """
+        reply = get_path(resp, RPC_REPLY)
+        return isinstance(reply, dict) and "ok" in reply
 
-        return NodeAlarms(alarms=alarms)
+    def _render(self, template: str, **params) -> bytes:
+        """
+        Fills in a payload template from app.services.payloads.
+        :param template: The payload template.
+        :param params: Values for the template's fields, message_id, username and session_id are filled in when missing.
+        :return: The request payload, encoded in the charset declared in the Content-Type header.
+        """
+        return template.format_map(
+            {
+                "message_id": self.message_id,
+                "username": CMS_USERNAME,
+                "session_id": self.session_id,
+                **params,
+            }
+        ).encode(PAYLOAD_ENCODING)
+
+    def _cached(self, cache: OrderedDict, key: tuple, ttl: float):
+        with self._cache_lock:
+            entry = cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[1] >= ttl:
+                del cache[key]
+                return None
+            cache.move_to_end(key)
+            # Every caller gets its own copy, so changing a returned model can not change the cached one
+            return entry[0].copy()
+
+    def _cache(self, cache: OrderedDict, key: tuple, value, size: int) -> None:
+        with self._cache_lock:
+            cache[key] = (value.copy(), time.monotonic())
+            cache.move_to_end(key)
+            while len(cache) > size:
+                cache.popitem(last=False)
 
-    # ----- Utility -----
     @property
     def message_id(self):
-        return str(random.getrandbits(random.randint(2, 31)))
-
-    @property
-    def headers(self):
-        return {
-            "Content-Type": "text/xml;charset=ISO8859-1",
-            "User-Agent": f"CMS_NBI_CONNECT-{CMS_USERNAME}",
-        }
+        return str(next(_MESSAGE_IDS))
 
     @staticmethod
     def generate_netconf_url(ip: str):
         return f"http://{ip}:18080/cmsexc/ex/netconf"
 
-    def __post(self, payload: str, timeout: int = 5):
+    def __post(
+        self,
+        payload: bytes,
+        timeout: int = 5,
+        select: dict | bool = True,
+        force_list: frozenset[str] = frozenset(),
+    ):
         try:
-            resp = requests.post(
+            with self._http.post(
                 url=self.netconf_url,
-                headers=self.headers,
                 data=payload,
                 timeout=timeout,
-            )
-            data = xmltodict.parse(resp.content)
+                stream=True,
+            ) as resp:
+                # Parse the body as it arrives, watching for the pagination marker
+                more = MarkerScanner(b"<more/>")
+                chunks = resp.iter_content(chunk_size=RESPONSE_CHUNK_SIZE)
+                data = parse_paths(map(more.feed, chunks), select, force_list)
 
-            return data, "<more/>" in str(resp.content)
+            return data, more.found
 
         except (
             requests.exceptions.MissingSchema,
             requests.exceptions.ConnectionError,
         ) as e:
-            print(e)
+            logger.warning("Could not reach the CMS at %s: %s", self.netconf_url, e)
             return [{}, False]
 
-        except xmltodict.ParsingInterrupted as e:
-            print(e)
-            return [{}, False]
+
+class AsyncCmsClient:
+    """
+    Awaitable wrapper around a CmsClient for polling many onts at once. Every CmsClient method is available as a
+    coroutine, the request runs on one of concurrency worker threads so at most that many are sent to the CMS at a time.
+    A client passed in stays owned by the caller, one created here is closed with the wrapper.
+    """
+
+    def __init__(self, client: CmsClient = None, concurrency: int = 32):
+        self._owns_client = client is None
+        self.client = client or CmsClient()
+        self._executor = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="cms"
+        )
+
+    def __getattr__(self, name):
+        # Private names, and lookups made before __init__ has run (copy, pickle), are not forwarded to the client
+        if name.startswith("_") or "client" not in vars(self):
+            raise AttributeError(name)
+
+        method = getattr(self.client, name)
+        if not callable(method):
+            return method
+
+        async def call(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, lambda: method(*args, **kwargs)
+            )
+
+        return call
+
+    async def get_ont_statuses(
+        self, node_id: str, ont_ids: list[str]
+    ) -> list[OntStatus]:
+        """
+        Retrieves the realtime status of several onts on the same node concurrently.
+        :param node_id: CMS node id excluding NTWK-. Ex: rsvt-pon-1.
+        :param ont_ids: The onts' ids. Ex: [18331, 18332]
+        :return: list[OntStatus], in the same order as ont_ids.
+        """
+        return list(
+            await asyncio.gather(
+                *(self.get_ont_status(node_id, ont_id) for ont_id in ont_ids)
+            )
+        )
+
+    async def get_ont_voice_services(
+        self, node_id: str, ont_ids: list[str], port_nr: int
+    ) -> list[OntVoice]:
+        """
+        Retrieves the voice service on the same port of several onts on the same node concurrently.
+        :param node_id: CMS node id excluding NTWK-. Ex: rsvt-pon-1.
+        :param ont_ids: The onts' ids, as returned by list_onts_on_gpon. Ex: [18331, 18332]
+        :param port_nr: The pots port on each ont. Ex: 1
+        :return: list[OntVoice], in the same order as ont_ids.
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.get_ont_voice_service(node_id, ont_id, port_nr)
+                    for ont_id in ont_ids
+                )
+            )
+        )
+
+    async def get_ont_full(
+        self, node_id: str, ont_id: str
+    ) -> tuple[OntGeneral, OntStatus, OntPerformance]:
+        """
+        Retrieves the configuration, status and bip errors of one ont concurrently, so the wait is the slowest of the
+        three requests instead of their sum.
+        :param node_id: CMS node id excluding NTWK-. Ex: rsvt-pon-1.
+        :param ont_id: The ont's id. Ex: 18331
+        :return: tuple[OntGeneral, OntStatus, OntPerformance]
+        """
+        general, status, performance = await asyncio.gather(
+            self.get_ont(node_id, ont_id),
+            self.get_ont_status(node_id, ont_id),
+            self.get_ont_performance(node_id, ont_id),
+        )
+        return general, status, performance
+
+    async def list_onts_on_gpons(
+        self, node_id: str, gpons: list[tuple[int, int, int]]
+    ) -> list[OntList]:
+        """
+        Lists the onts on several gpons of the same node concurrently, for walking a whole node.
+        :param node_id: CMS node id excluding NTWK-. Ex: rsvt-pon-1.
+        :param gpons: (shelf, card, gpon) of every gpon. Ex: [(1, 1, 1), (1, 1, 2)]
+        :return: list[OntList], in the same order as gpons.
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.list_onts_on_gpon(node_id, shelf_nr, card_nr, gpon_nr)
+                    for shelf_nr, card_nr, gpon_nr in gpons
+                )
+            )
+        )
+
+    async def get_nodes_alarms(self, node_ids: list[str] = None) -> list[NodeAlarms]:
+        """
+        Retrieves the active alarms of several nodes concurrently, each node still pages through its own alarms.
+        :param node_ids: CMS node ids excluding NTWK-, every node in the environment variable CMS_NODES when not given.
+        Ex: ["rsvt-pon-1", "rsvt-pon-2"]
+        :return: list[NodeAlarms], in the same order as node_ids.
+        """
+        if node_ids is None:
+            node_ids = [node_id.strip() for node_id in CMS_NODES.split(",")]
+        return list(
+            await asyncio.gather(
+                *(self.get_node_alarms(node_id) for node_id in node_ids)
+            )
+        )
+
+    async def get_xdsl_full(
+        self, node_id: str, shelf_nr: int, card_nr: int, interface_id: int
+    ) -> tuple[ModemStatus, ModemPerformance, XDSLLineTest]:
+        """
+        Retrieves the status, code violations and a line test of one modem concurrently, so the wait is the slowest
+        of the three requests instead of their sum.
+        :param node_id: CMS node id excluding NTWK-. Ex: rsvt-pon-1.
+        :param shelf_nr: The modem's shelf. Ex: 1
+        :param card_nr: The modem's card. Ex: 1
+        :param interface_id: The modem's interface. Ex: 1
+        :return: tuple[ModemStatus, ModemPerformance, XDSLLineTest]
+        """
+        status, performance, line_test = await asyncio.gather(
+            self.get_xdsl_status(node_id, shelf_nr, card_nr, interface_id),
+            self.get_xdsl_performance(node_id, shelf_nr, card_nr, interface_id),
+            self.run_xdsl_line_test(node_id, shelf_nr, card_nr, interface_id),
+        )
+        return status, performance, line_test
+
+    def close(self) -> None:
+        """
+        Stops the worker threads once their pending requests are done, and closes the CmsClient if it was created by
+        this wrapper.
+        :return: None
+        """
+        self._executor.shutdown(wait=True)
+        if self._owns_client:
+            self.client.close()
@@ -33,6 +33,7 @@ def get_env(env_name: str, prefer_local=True) -> str:
 CMS_IP = get_env("CMS_IP")
 CMS_USERNAME = get_env("CMS_USERNAME")
 CMS_PASSWORD = get_env("CMS_PASSWORD")
+# Comma separated CMS node ids excluding NTWK-, used when a request covers every node. Ex: rsvt-pon-1,rsvt-pon-2
 CMS_NODES = get_env("CMS_NODES")
 
 API_URL = get_env("API_URL")
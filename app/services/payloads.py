@@ -0,0 +1,728 @@
+# Standard Library Imports
+import re
+
+
+def compact(template: str) -> str:
+    """
+    Removes the indentation and line breaks between the tags of a payload template so they are not sent to the CMS.
+    :param template: Xml payload template.
+    :return: The template with whitespace between tags removed.
+    """
+    return re.sub(r"(?<=[>}])\s+(?=[<{])", "", template.strip())
+
+
+class _Placeholders(dict):
+    def __missing__(self, key):
+        return f"{{{key}}}"
+
+
+def prefill(template: str, **params) -> str:
+    """
+    Fills in some of the fields of a payload template ahead of time, leaving the rest for CmsClient._render.
+    :param template: Payload template.
+    :param params: Values of the fields to fill in.
+    :return: The template with only the remaining fields left.
+    """
+    return template.format_map(_Placeholders(params))
+
+
+# Request payload templates, filled in with str.format_map by CmsClient._render. Every template takes message_id,
+# username and session_id in addition to the fields named in it.
+
+LOGIN = compact(
+    """
+    <?xml version="1.0" encoding="UTF-8"?>
+    <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+    <auth message-id="{message_id}">
+        <login>
+            <UserName>{username}</UserName>
+            <Password>{password}</Password>
+        </login>
+    </auth>
+    </soapenv:Body>
+    </soapenv:Envelope>
+    """
+)
+
+LOGOUT = compact(
+    """
+    <?xml version="1.0" encoding="UTF-8"?>
+    <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+    <auth message-id="{message_id}">
+        <logout>
+            <UserName>{username}</UserName>
+            <SessionId>{session_id}</SessionId>
+        </logout>
+    </auth>
+    </soapenv:Body>
+    </soapenv:Envelope>
+    """
+)
+
+GET_ONTS = compact(
+    """
+    <soapenv:Envelope xmlns:soapenv="www.w3.org/2003/05/soap-envelope">
+    <soapenv:Body>
+    <rpc message-id="{message_id}" nodename="NTWK-{node_id}" username="{username}" sessionid="{session_id}">
+        <get-config>
+            <source>
+                <running/>
+            </source>
+            <filter type="subtree">
+                <top>{ont_filters}
+                </top>
+            </filter>
+        </get-config>
+    </rpc>
+    </soapenv:Body>
+    </soapenv:Envelope>
+    """
+)
+
+# One Ont object in the filter of GET_ONTS.
+ONT_FILTER = compact(
+    """
+    <object>
+        <type>Ont</type>
+        <id>
+            <ont>{ont_id}</ont>
+        </id>
+    </object>
+    """
+)
+
+GET_ONT_STATUS = compact(
+    """
+    <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+    <rpc message-id="{message_id}" nodename="NTWK-{node_id}" username="{username}" sessionid="{session_id}">
+        <action>
+            <action-type>show-ont</action-type>
+            <action-args>
+                <ont>
+                    <type>Ont</type>
+                    <id><ont>{ont_id}</ont></id>
+                </ont>
+            </action-args>
+        </action>
+    </rpc>
+    </soapenv:Body>
+    </soapenv:Envelope>
+    """
+)
+
+GET_ONT_PERFORMANCE = compact(
+    """
+    <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+    <rpc message-id="{message_id}" nodename="NTWK-{node_id}" username="{username}" sessionid="{session_id}">
+        <action>
+            <action-type>show-ont-pm</action-type>
+            <action-args>
+                <object>
+                    <type>Ont</type>
+                    <id>
+                        <ont>{ont_id}</ont>
+                    </id>
+                </object>
+                <bin-type>1-day</bin-type>
+                <start-bin>1</start-bin>
+                <count>1</count>
+            </action-args>
+        </action>
+    </rpc>
+    </soapenv:Body>
+    </soapenv:Envelope>
+    """
+)
+
+GET_ONT_PORT = compact(
+    """
+    <soapenv:Envelope xmlns:soapenv="www.w3.org/2003/05/soap-envelope">
+    <soapenv:Body>
+    <rpc message-id="{message_id}" nodename="NTWK-{node_id}" username="{username}" sessionid="{session_id}">
+        <get-config>
+            <source>
+                <running/>
+            </source>
+            <filter type="subtree">
+                <top>
+                    <object>
+                    <type>OntEthGe</type>
+                    <id>
+                        <ont>{ont_id}</ont>
+                        <ontslot>3</ontslot>
+                        <ontethge>{port_nr}</ontethge>
+                    </id>
+                    </object>
+                </top>
+            </filter>
+        </get-config>
+    </rpc>
+    </soapenv:Body>
+    </soapenv:Envelope>
+    """
+)
+
+GET_ONT_PORT_DATA_SERVICE = compact(
+    """
+    <soapenv:Envelope xmlns:soapenv="www.w3.org/2003/05/soap-envelope">
+    <soapenv:Body>
+    <rpc message-id="{message_id}" nodename="NTWK-{node_id}" username="{username}" sessionid="{session_id}">
+        <get-config>
+            <source>
+                <running/>
+            </source>
+            <filter type="subtree">
+                <top>
+                    <object>
+                    <type>OntEthGe</type>
+                    <id>
+                        <ont>{ont_id}</ont>
+                        <ontslot>3</ontslot>
+                        <ontethge>{port_nr}</ontethge>
+                    </id>
+                    <children>
+                        <type>EthSvc</type>
+                        <attr-list>admin descr tag-action bw-prof out-tag in-tag mcast-prof pon-cos us-cir-override us-pir-override ds-pir-override hot-swap pppoe-force-discard</attr-list>
+                    </children>
+                    </object>
+                </top>
+            </filter>
+        </get-config>
+    </rpc>
+    </soapenv:Body>
+    </soapenv:Envelope>
+    """
+)
+
+GET_ONT_VOICE_SERVICE = compact(
+    """
+    <soapenv:Envelope xmlns:soapenv="www.w3.org/2003/05/soap-envelope">
+    <soapenv:Body>
+    <rpc message-id="{message_id}" nodename="NTWK-{node_id}" username="{username}" sessionid="{session_id}">
+        <get-config>
+            <source>
+                <running/>
+            </source>
+            <filter type="subtree">
+                <top>
+                    <object>
+                    <type>OntPots</type>
+                    <id>
+                        <ont>{ont_id}</ont>
+                        <ontslot>6</ontslot>
+                        <ontpots>{port_nr}</ontpots>
+                    </id>
+                    </object>
+                </top>
+            </filter>
+        </get-config>
+    </rpc>
+    </soapenv:Body>
+    </soapenv:Envelope>
+    """
+)
+
+LIST_ONTS_ON_GPON = compact(
+    """
+    <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+    <rpc message-id="{message_id}" nodename="NTWK-{node_id}" username="{username}" sessionid="{session_id}">
+        <get-config>
+            <source>
+                <running/>
+            </source>
+            <filter type="subtree">
+                <top>
+                    <object>
+                        <type>System</type>
+                        <id/>
+                        <children>
+                            <type>Ont</type>
+                            <attr-filter>
+                                <linked-pon>
+                                    <type>GponPort</type>
+                                    <id>
+                                        <shelf>{shelf_nr}</shelf>
+                                        <card>{card_nr}</card>
+                                        <gponport>{gpon_nr}</gponport>
+                                    </id>
+                                </linked-pon>
+                            </attr-filter>
+                        </children>
+                    </object>
+                </top>
+            </filter>
+        </get-config>
+    </rpc>
+    </soapenv:Body>
+    </soapenv:Envelope>
+    """
+)
+
+RESET_ONT_PERFORMANCE = compact(
+    """
+    <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+    <rpc message-id="{message_id}" nodename="NTWK-{node_id}" username="{username}" sessionid="{session_id}">
+        <action>
+            <action-type>clear-ont-pm</action-type>
+            <action-args>
+                <object>
+                    <type>Ont</type>
+                    <id>
+                        <ont>{ont_id}</ont>
+                    </id>
+                </object>
+                <bin-type>1-day</bin-type>
+                <start-bin>1</start-bin>
+                <count>8</count>
+            </action-args>
+        </action>
+    </rpc>
+    </soapenv:Body>
+    </soapenv:Envelope>
+    """
+)
+
+RESET_ONT = compact(
+    """
+    <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+    <rpc message-id="{message_id}" nodename="NTWK-{node_id}" username="{username}" sessionid="{session_id}">
+        <action>
+            <action-type>
+                reset-ont
+            </action-type>
+            <action-args>
+                <object>
+                    <type>Ont</type>
+                    <id>
+                        <ont>{ont_id}</ont>
+                    </id>
+                </object>
+                <force>{force}</force>
+            </action-args>
+        </action>
+    </rpc>
+    </soapenv:Body>
+    </soapenv:Envelope>
+    """
+)
+
+QUARANTINE_ONT = compact(
+    """
+    <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+        <rpc message-id="{message_id}" nodename="NTWK-{node_id}" username="{username}" sessionid="{session_id}">
+        <edit-config>
+            <target>
+                <running/>
+            </target>
+            <config>
+                <top>
+                    <object get-config="true" operation="create">
+                        <type>QuarOnt</type>
+                        <id>
+                            <quaront>CXNK{ont_serial_nr}</quaront>
+                        </id>
+                    </object>
+                </top>
+            </config>
+        </edit-config>
+    </rpc>
+    </soapenv:Body>
+    </soapenv:Envelope>
+    """
+)
+
+RELEASE_ONT = compact(
+    """
+    <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+        <rpc message-id="{message_id}" nodename="NTWK-{node_id}" username="{username}" sessionid="{session_id}">
+        <edit-config>
+            <target>
+                <running/>
+            </target>
+            <config>
+                <top>
+                    <object operation="delete">
+                        <type>QuarOnt</type>
+                        <id>
+                            <quaront>CXNK{ont_serial_nr}</quaront>
+                        </id>
+                    </object>
+                </top>
+            </config>
+        </edit-config>
+    </rpc>
+    </soapenv:Body>
+    </soapenv:Envelope>
+    """
+)
+
+DISABLE_ONT = compact(
+    """
+    <soapenv:Envelope xmlns:soapenv="www.w3.org/2003/05/soap-envelope">
+    <soapenv:Body>
+    <rpc message-id="{message_id}" nodename="NTWK-{node_id}" username="{username}" sessionid="{session_id}">
+        <edit-config>
+            <target>
+                <running/>
+            </target>
+            <config>
+                <top>
+                    <object operation="merge">
+                        <type>Ont</type>
+                        <id>
+                            <ont>{ont_id}</ont>
+                        </id>
+                        <admin>disabled</admin>
+                    </object>
+                </top>
+            </config>
+        </edit-config>
+    </rpc>
+    </soapenv:Body>
+    </soapenv:Envelope>
+    """
+)
+
+DISABLE_ONT_PORT = compact(
+    """
+    <soapenv:Envelope xmlns:soapenv="www.w3.org/2003/05/soap-envelope">
+    <soapenv:Body>
+    <rpc message-id="{message_id}" nodename="NTWK-{node_id}" username="{username}" sessionid="{session_id}">
+        <edit-config>
+            <target>
+                <running/>
+            </target>
+            <config>
+                <top>
+                    <object operation="merge">
+                        <type>OntEthGe</type>
+                        <id>
+                            <ont>{ont_id}</ont>
+                            <ontslot>3</ontslot>
+                            <ontethge>{port_nr}</ontethge>
+                        </id>
+                        <admin>disabled</admin>
+                    </object>
+                </top>
+            </config>
+        </edit-config>
+    </rpc>
+    </soapenv:Body>
+    </soapenv:Envelope>
+    """
+)
+
+ENABLE_ONT = compact(
+    """
+    <soapenv:Envelope xmlns:soapenv="www.w3.org/2003/05/soap-envelope">
+    <soapenv:Body>
+    <rpc message-id="{message_id}" nodename="NTWK-{node_id}" username="{username}" sessionid="{session_id}">
+        <edit-config>
+            <target>
+                <running/>
+            </target>
+            <config>
+                <top>
+                    <object operation="merge">
+                        <type>Ont</type>
+                        <id>
+                            <ont>{ont_id}</ont>
+                        </id>
+                        <admin>enabled</admin>
+                    </object>
+                </top>
+            </config>
+        </edit-config>
+    </rpc>
+    </soapenv:Body>
+    </soapenv:Envelope>
+    """
+)
+
+ENABLE_ONT_PORT = compact(
+    """
+    <soapenv:Envelope xmlns:soapenv="www.w3.org/2003/05/soap-envelope">
+    <soapenv:Body>
+    <rpc message-id="{message_id}" nodename="NTWK-{node_id}" username="{username}" sessionid="{session_id}">
+        <edit-config>
+            <target>
+                <running/>
+            </target>
+            <config>
+                <top>
+                    <object operation="merge">
+                        <type>OntEthGe</type>
+                        <id>
+                            <ont>{ont_id}</ont>
+                            <ontslot>3</ontslot>
+                            <ontethge>{port_nr}</ontethge>
+                        </id>
+                        <admin>enabled</admin>
+                    </object>
+                </top>
+            </config>
+        </edit-config>
+    </rpc>
+    </soapenv:Body>
+    </soapenv:Envelope>
+    """
+)
+
+GET_XDSL_INTERFACE = compact(
+    """
+    <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+    <rpc message-id="{message_id}" nodename="NTWK-{node_id}" username="{username}" sessionid="{session_id}">
+        <get-config>
+            <source>
+                <running/>
+            </source>
+            <filter type="subtree">
+                <top>
+                    <object>
+                        <type>EthIntf</type>
+                        <id>
+                            <shelf>{shelf_nr}</shelf>
+                            <card>{card_nr}</card>
+                            <ethintf>{ethintf}</ethintf>
+                        </id>
+                    </object>
+                </top>
+            </filter>
+        </get-config>
+    </rpc>
+    </soapenv:Body>
+    </soapenv:Envelope>
+    """
+)
+
+GET_XDSL_PORT = compact(
+    """
+    <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+    <rpc message-id="{message_id}" nodename="NTWK-{node_id}" username="{username}" sessionid="{session_id}">
+        <get-config>
+            <source>
+                <running/>
+            </source>
+            <filter type="subtree">
+                <top>
+                    <object>
+                        <type>DslPort</type>
+                        <id>
+                            <shelf>{shelf_nr}</shelf>
+                            <card>{card_nr}</card>
+                            <dslport>{interface_id}</dslport>
+                        </id>
+                    </object>
+                </top>
+            </filter>
+        </get-config>
+    </rpc>
+    </soapenv:Body>
+    </soapenv:Envelope>
+    """
+)
+
+# Attributes requested by GET_XDSL_STATUS when the caller does not narrow them down.
+XDSL_STATUS_ATTRS = (
+    "op-stat derived-states op mode act init data-mode op-time ahc retrain-count last-templ act-vec-mode vec-state "
+    "oper-status power-save-timer act-psd-mask us-rate us-delay us-inp us-snrm us-la us-att-rate us-atp us-atmptm "
+    "us-enh-inp us-rtx-etr us-rtx-inp-shine us-rtx-inp-rein us-rtx-delay ds-rate ds-delay ds-inp ds-snrm ds-atten "
+    "ds-att-rate ds-atp ds-atmptm ds-enh-inp ds-rtx-etr ds-rtx-inp-shine ds-rtx-inp-rein ds-rtx-delay"
+)
+
+GET_XDSL_STATUS = compact(
+    """
+    <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+    <rpc message-id="{message_id}" nodename="NTWK-{node_id}" username="{username}" sessionid="{session_id}">
+        <get>
+            <filter type="subtree">
+                <top>
+                    <object>
+                        <type>DslPort</type>
+                        <id>
+                            <shelf>{shelf_nr}</shelf>
+                            <card>{card_nr}</card>
+                            <dslport>{interface_id}</dslport>
+                        </id>
+                        <attr-list>{attr_list}</attr-list>
+                    </object>
+                </top>
+            </filter>
+        </get>
+    </rpc>
+    </soapenv:Body>
+    </soapenv:Envelope>
+    """
+)
+
+GET_XDSL_STATUSES = compact(
+    """
+    <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+    <rpc message-id="{message_id}" nodename="NTWK-{node_id}" username="{username}" sessionid="{session_id}">
+        <get>
+            <filter type="subtree">
+                <top>{port_filters}
+                </top>
+            </filter>
+        </get>
+    </rpc>
+    </soapenv:Body>
+    </soapenv:Envelope>
+    """
+)
+
+# One DslPort object in the filter of GET_XDSL_STATUSES.
+XDSL_STATUS_FILTER = compact(
+    """
+    <object>
+        <type>DslPort</type>
+        <id>
+            <shelf>{shelf_nr}</shelf>
+            <card>{card_nr}</card>
+            <dslport>{interface_id}</dslport>
+        </id>
+        <attr-list>{attr_list}</attr-list>
+    </object>
+    """
+)
+
+GET_XDSL_PERFORMANCE = compact(
+    """
+    <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+    <rpc message-id="{message_id}" nodename="NTWK-{node_id}" username="{username}" sessionid="{session_id}">
+        <action>
+            <action-type>show-dsl-pm</action-type>
+            <action-args>
+                <object>
+                    <type>DslPort</type>
+                    <id>
+                        <shelf>{shelf_nr}</shelf>
+                        <card>{card_nr}</card>
+                        <dslport>{interface_id}</dslport>
+                    </id>
+                </object>
+                <bin-type>1-day</bin-type>
+                <start-bin>1</start-bin>
+                <count>1</count>
+            </action-args>
+        </action>
+    </rpc>
+    </soapenv:Body>
+    </soapenv:Envelope>
+    """
+)
+
+RUN_XDSL_LINE_TEST = compact(
+    """
+    <soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+    <soapenv:Body>
+    <rpc message-id="{message_id}" nodename="NTWK-{node_id}" username="{username}" sessionid="{session_id}">
+        <action>
+            <action-type>test-pots-svc</action-type>
+            <action-args>
+                <pots>
+                    <type>Pots</type>
+                    <id>
+                        <shelf>{shelf_nr}</shelf>
+                        <card>{card_nr}</card>
+                        <pots>{interface_id}</pots>
+                    </id>
+                </pots>
+            </action-args>
+        </action>
+    </rpc>
+    </soapenv:Body>
+    </soapenv:Envelope>
+    """
+)
+
+# Admin state change of a DslPort or DslBondIntf, the fixed parts are filled in by prefill below.
+SET_XDSL_ADMIN = compact(
+    """
+    <soapenv:Envelope xmlns:soapenv="{soap_ns}">
+    <soapenv:Body>
+    <rpc message-id="{message_id}" nodename="NTWK-{node_id}" username="{username}" sessionid="{session_id}">
+        <edit-config>
+            <target>
+                <running/>
+            </target>
+            <config>
+                <top>
+                    <object operation="merge">
+                        <type>{object_type}</type>
+                        <id>
+                            <shelf>{shelf_nr}</shelf>
+                            <card>{card_nr}</card>
+                            <{id_tag}>{interface_id}</{id_tag}>
+                        </id>
+                        <admin>{admin}</admin>
+                    </object>
+                </top>
+            </config>
+        </edit-config>
+    </rpc>
+    </soapenv:Body>
+    </soapenv:Envelope>
+    """
+)
+
+DISABLE_XDSL_PORT = prefill(
+    SET_XDSL_ADMIN,
+    soap_ns="www.w3.org/2003/05/soap-envelope",
+    object_type="DslPort",
+    id_tag="dslport",
+    admin="disabled",
+)
+
+ENABLE_XDSL_PORT = prefill(
+    SET_XDSL_ADMIN,
+    soap_ns="www.w3.org/2003/05/soap-envelope",
+    object_type="DslPort",
+    id_tag="dslport",
+    admin="enabled-no-alarms",
+)
+
+ENABLE_XDSL_BONDING_GROUP = prefill(
+    SET_XDSL_ADMIN,
+    soap_ns="http://schemas.xmlsoap.org/soap/envelope/",
+    object_type="DslBondIntf",
+    id_tag="dslbondintf",
+    admin="enabled-no-alarms",
+)
+
+DISABLE_XDSL_BONDING_GROUP = prefill(
+    SET_XDSL_ADMIN,
+    soap_ns="http://schemas.xmlsoap.org/soap/envelope/",
+    object_type="DslBondIntf",
+    id_tag="dslbondintf",
+    admin="disabled",
+)
+
+GET_NODE_ALARMS = compact(
+    """
+    <soapenv:Envelope xmlns:soapenv="www.w3.org/2003/05/soap-envelope">
+    <soapenv:Body>
+    <rpc message-id="{message_id}" nodename="NTWK-{node_id}" username="{username}" sessionid="{session_id}">
+        <action>
+            <action-type>show-alarms</action-type>
+            {action_args}
+        </action>
+    </rpc>
+    </soapenv:Body>
+    </soapenv:Envelope>
+    """
+)
@@ -1,11 +1,42 @@
+import asyncio
+import copy
+import io
+import time
 import unittest
+import weakref
+from unittest import mock
+
+import requests
+import xmltodict
 
 from app.models.exceptions import (
     CmsCommunicationFailure,
     CmsAuthenticationFailure,
     CmsDeauthenticationFailure,
 )
-from app.services.cms import CmsClient
+from app.models.modem import ModemStatus, NodeAlarms
+from app.models.ont import OntGeneral, OntList, OntService, OntVoice
+from app.services import cms
+from app.services.cms import AsyncCmsClient, CmsClient
+
+
+def reply(client, *bodies):
+    """Answers the client's next requests with bodies instead of sending them to the CMS."""
+    responses = []
+    for body in bodies:
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(body)
+        responses.append(response)
+    return mock.patch.object(client._http, "post", side_effect=responses)
+
+
+def rpc_reply(data):
+    return (
+        '<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">'
+        f"<soapenv:Body><rpc-reply><data><top>{data}</top></data></rpc-reply>"
+        "</soapenv:Body></soapenv:Envelope>"
+    ).encode()
 
 
 class TestCmsAuthentication(unittest.TestCase):
@@ -38,9 +69,427 @@ class TestCmsAuthentication(unittest.TestCase):
         client.logout()
 
 
+class TestCmsSessionCache(unittest.TestCase):
+    def tearDown(self):
+        cms._SESSION_CACHE.clear()
+
+    def test_login_reuses_cached_session(self):
+        client = CmsClient()
+        client.netconf_url = client.generate_netconf_url("0.0.0.0")
+        cms._SESSION_CACHE[(client.netconf_url, cms.CMS_USERNAME, cms.CMS_PASSWORD)] = (
+            "cached session",
+            time.monotonic(),
+            weakref.WeakSet(),
+        )
+        self.assertEqual(client.login(), "cached session")
+        self.assertEqual(client.session_id, "cached session")
+
+    def test_login_refreshes_reused_session(self):
+        client = CmsClient()
+        client.netconf_url = client.generate_netconf_url("0.0.0.0")
+        cache_key = (client.netconf_url, cms.CMS_USERNAME, cms.CMS_PASSWORD)
+        cms._SESSION_CACHE[cache_key] = (
+            "old session",
+            time.monotonic() - cms.SESSION_TTL + 1,
+            weakref.WeakSet(),
+        )
+        client.login()
+        self.assertLess(time.monotonic() - cms._SESSION_CACHE[cache_key][1], 1)
+
+    def test_login_ignores_expired_session(self):
+        client = CmsClient()
+        client.netconf_url = client.generate_netconf_url("0.0.0.0")
+        cms._SESSION_CACHE[(client.netconf_url, cms.CMS_USERNAME, cms.CMS_PASSWORD)] = (
+            "expired session",
+            time.monotonic() - cms.SESSION_TTL,
+            weakref.WeakSet(),
+        )
+        with self.assertRaises(CmsCommunicationFailure):
+            client.login()
+
+    def test_logout_keeps_session_shared_with_other_clients(self):
+        first, second = CmsClient(), CmsClient()
+        first.netconf_url = second.netconf_url = first.generate_netconf_url("0.0.0.0")
+        cache_key = (first.netconf_url, cms.CMS_USERNAME, cms.CMS_PASSWORD)
+        cms._SESSION_CACHE[cache_key] = (
+            "shared session",
+            time.monotonic(),
+            weakref.WeakSet(),
+        )
+        first.login()
+        second.login()
+
+        # The session is still in use, so no logout is sent to the unreachable CMS
+        first.logout()
+        self.assertIsNone(first.session_id)
+        self.assertEqual(second.session_id, "shared session")
+        self.assertIn(cache_key, cms._SESSION_CACHE)
+
+        # The last client to log out ends the session on the CMS
+        with self.assertRaises(CmsCommunicationFailure):
+            second.logout()
+        self.assertNotIn(cache_key, cms._SESSION_CACHE)
+
+
+class TestCmsConfigCache(unittest.TestCase):
+    def setUp(self):
+        self.client = CmsClient()
+        self.client.netconf_url = self.client.generate_netconf_url("0.0.0.0")
+        self.ont = OntGeneral(parent_node="node", id="1", description="cached ont")
+
+    def cache(self, key, value=None):
+        self.client._cache(
+            self.client._config_cache, key, value or self.ont, cms.CONFIG_CACHE_SIZE
+        )
+
+    def test_get_ont_uses_cache(self):
+        self.cache(("node", "1", None))
+        self.assertEqual(self.client.get_ont("node", 1), self.ont)
+
+    def test_get_ont_port_data_service_uses_cache(self):
+        service = OntService(parent_node="node", id="1", port_number=2, admin="up")
+        self.cache(("node", "1", "2", "data_service"), service)
+        self.assertEqual(self.client.get_ont_port_data_service("node", 1, 2), service)
+
+    def test_get_ont_voice_service_uses_cache(self):
+        voice = OntVoice(parent_node="node", id="1", port_number=2, admin="up")
+        self.cache(("node", "1", "2", "voice_service"), voice)
+        self.assertEqual(self.client.get_ont_voice_service("node", 1, 2), voice)
+
+    def test_cached_models_are_copies(self):
+        self.cache(("node", "1", None))
+        self.ont.description = "changed by the caller"
+        self.client.get_ont("node", 1).description = "changed by the caller"
+        self.assertEqual(self.client.get_ont("node", 1).description, "cached ont")
+
+    def test_invalidate(self):
+        self.cache(("node", "1", None))
+        self.cache(("node", "1", "2"))
+        self.cache(("node", "3", None))
+        self.client.invalidate("node", "1")
+        self.assertEqual(list(self.client._config_cache), [("node", "3", None)])
+
+    def test_ont_writes_invalidate(self):
+        for write, args in [
+            ("reset_ont_performance", ("node", "1")),
+            ("reset_ont", ("node", "1")),
+            ("disable_ont", ("node", "1")),
+            ("disable_ont_port", ("node", "1", "2")),
+            ("enable_ont", ("node", "1")),
+            ("enable_ont_port", ("node", "1", "2")),
+        ]:
+            with self.subTest(write):
+                self.cache(("node", "1", None))
+                self.client._cache(
+                    self.client._status_cache,
+                    ("ont_status", "node", "1"),
+                    self.ont,
+                    cms.STATUS_CACHE_SIZE,
+                )
+                getattr(self.client, write)(*args)
+                self.assertEqual(len(self.client._config_cache), 0)
+                self.assertEqual(len(self.client._status_cache), 0)
+
+    def test_xdsl_writes_invalidate(self):
+        status = ModemStatus(parent_node="node", shelf=1, card=2, interface=3)
+        for write in [
+            "disable_xdsl_port",
+            "enable_xdsl_port",
+            "enable_xdsl_bonding_group",
+            "disable_xdsl_bonding_group",
+        ]:
+            with self.subTest(write):
+                self.client._cache(
+                    self.client._status_cache,
+                    ("status", "node", "1", "2", "3", None),
+                    status,
+                    cms.STATUS_CACHE_SIZE,
+                )
+                getattr(self.client, write)("node", 1, 2, 3)
+                self.assertEqual(len(self.client._status_cache), 0)
+
+    def test_expired_entry_is_dropped(self):
+        self.client._config_cache[("node", "1", None)] = (
+            self.ont,
+            time.monotonic() - cms.CONFIG_TTL,
+        )
+        self.assertIsNone(
+            self.client._cached(
+                self.client._config_cache, ("node", "1", None), cms.CONFIG_TTL
+            )
+        )
+        self.assertEqual(len(self.client._config_cache), 0)
+
+    def test_get_xdsl_status_uses_cache(self):
+        status = ModemStatus(
+            parent_node="node", shelf=1, card=2, interface=3, operational_status="up"
+        )
+        self.client._cache(
+            self.client._status_cache,
+            ("status", "node", "1", "2", "3", None),
+            status,
+            cms.STATUS_CACHE_SIZE,
+        )
+        self.assertEqual(self.client.get_xdsl_status("node", 1, 2, 3), status)
+
+
+class TestAsyncCmsClient(unittest.TestCase):
+    def test_get_ont_statuses_keeps_order(self):
+        client = CmsClient()
+        client.netconf_url = client.generate_netconf_url("0.0.0.0")
+        async_client = AsyncCmsClient(client, concurrency=2)
+        statuses = asyncio.run(async_client.get_ont_statuses("node", ["1", "2", "3"]))
+        async_client.close()
+        self.assertEqual([status.id for status in statuses], ["1", "2", "3"])
+
+    def test_get_xdsl_full(self):
+        client = CmsClient()
+        client.netconf_url = client.generate_netconf_url("0.0.0.0")
+        async_client = AsyncCmsClient(client, concurrency=3)
+        status, performance, line_test = asyncio.run(
+            async_client.get_xdsl_full("node", 1, 2, 3)
+        )
+        async_client.close()
+        self.assertEqual((status.shelf, status.card, status.interface), (1, 2, 3))
+        self.assertEqual(performance.interface, 3)
+        self.assertEqual(line_test.interface, 3)
+
+    def test_get_ont_voice_services_keeps_order(self):
+        client = CmsClient()
+        client.netconf_url = client.generate_netconf_url("0.0.0.0")
+        async_client = AsyncCmsClient(client, concurrency=2)
+        voices = asyncio.run(
+            async_client.get_ont_voice_services("node", ["1", "2", "3"], 1)
+        )
+        async_client.close()
+        self.assertEqual([voice.id for voice in voices], ["1", "2", "3"])
+
+    def test_get_ont_full(self):
+        client = CmsClient()
+        client.netconf_url = client.generate_netconf_url("0.0.0.0")
+        async_client = AsyncCmsClient(client, concurrency=3)
+        general, status, performance = asyncio.run(
+            async_client.get_ont_full("node", "1")
+        )
+        async_client.close()
+        self.assertEqual((general.id, status.id, performance.id), ("1", "1", "1"))
+
+    def test_list_onts_on_gpons_keeps_order(self):
+        client = CmsClient()
+        async_client = AsyncCmsClient(client, concurrency=2)
+        gpons = [(1, 1, 1), (1, 1, 2), (1, 2, 1)]
+        with mock.patch.object(
+            client,
+            "list_onts_on_gpon",
+            side_effect=lambda node_id, *gpon: OntList(onts=[str(gpon)], ont_count=1),
+        ):
+            lists = asyncio.run(async_client.list_onts_on_gpons("node", gpons))
+        async_client.close()
+        self.assertEqual(
+            [ont_list.onts[0] for ont_list in lists], list(map(str, gpons))
+        )
+
+    def test_private_names_are_not_forwarded(self):
+        async_client = AsyncCmsClient(CmsClient(), concurrency=1)
+        with self.assertRaises(AttributeError):
+            async_client._http
+        self.assertEqual(
+            copy.copy(async_client).client.netconf_url, async_client.client.netconf_url
+        )
+        async_client.close()
+
+    def test_get_nodes_alarms_defaults_to_cms_nodes(self):
+        client = CmsClient()
+        client.netconf_url = client.generate_netconf_url("0.0.0.0")
+        async_client = AsyncCmsClient(client, concurrency=2)
+        with mock.patch.object(cms, "CMS_NODES", "node-1, node-2,node-3"):
+            with mock.patch.object(
+                client,
+                "get_node_alarms",
+                side_effect=lambda node_id: NodeAlarms(alarms=[{"node": node_id}]),
+            ):
+                alarms = asyncio.run(async_client.get_nodes_alarms())
+        async_client.close()
+        self.assertEqual(
+            [node.alarms[0]["node"] for node in alarms], ["node-1", "node-2", "node-3"]
+        )
+
+
+class TestFieldSpec(unittest.TestCase):
+    spec = cms.field_spec({"a": "x.y", "b": ("z", cms.is_true)})
+
+    def test_build_fields(self):
+        data = {"x": {"y": "1"}, "z": "true"}
+        self.assertEqual(cms.build_fields(data, self.spec), {"a": "1", "b": True})
+
+    def test_build_fields_missing(self):
+        self.assertEqual(
+            cms.build_fields({"x": "1"}, self.spec), {"a": None, "b": False}
+        )
+        self.assertEqual(cms.build_fields(None, self.spec), {"a": None, "b": False})
+
+
+class TestXdslStatusAttrs(unittest.TestCase):
+    def test_narrowed_attr_list(self):
+        attrs = cms.xdsl_status_attrs(frozenset({"downstream_rate", "upstream_rate"}))
+        payload = CmsClient()._render(
+            cms.payloads.GET_XDSL_STATUS,
+            node_id="node",
+            shelf_nr=1,
+            card_nr=2,
+            interface_id=3,
+            attr_list=attrs,
+        )
+        self.assertIn(b"<card>2</card><dslport>3</dslport>", payload)
+        self.assertIn(b"<attr-list>us-rate ds-rate</attr-list>", payload)
+
+    def test_every_field_can_be_requested(self):
+        for name, _, _ in cms.MODEM_STATUS_FIELDS:
+            with self.subTest(name):
+                self.assertTrue(cms.xdsl_status_attrs(frozenset({name})))
+
+    def test_unknown_fields(self):
+        with self.assertRaises(ValueError):
+            cms.xdsl_status_attrs(frozenset())
+        with self.assertRaises(ValueError):
+            cms.xdsl_status_attrs(frozenset({"upstream_rate", "upstream_rat"}))
+
+
+class TestParsePaths(unittest.TestCase):
+    document = b"""
+        <a>
+            <b x="1">one</b>
+            <c><d>two</d><e>three</e></c>
+            <c><d>four</d></c>
+            <f><g>skipped</g></f>
+        </a>"""
+
+    def test_keeps_selected_paths(self):
+        paths = [("a", "b", "@x"), ("a", "c", "d")]
+        parsed = cms.parse_paths([self.document], cms.select_paths(paths))
+        self.assertEqual(
+            parsed,
+            {
+                "a": {
+                    "b": {"@x": "1", "#text": "one"},
+                    "c": [{"d": "two"}, {"d": "four"}],
+                }
+            },
+        )
+
+    def test_keeps_everything(self):
+        self.assertEqual(
+            cms.parse_paths([self.document], True), xmltodict.parse(self.document)
+        )
+
+    def test_force_list(self):
+        paths = cms.select_paths([("a", "b"), ("a", "f")])
+        parsed = cms.parse_paths([self.document], paths, frozenset({"b", "g"}))
+        self.assertEqual(
+            parsed,
+            {"a": {"b": [{"@x": "1", "#text": "one"}], "f": {"g": "skipped"}}},
+        )
+
+    def test_no_match(self):
+        self.assertEqual(
+            cms.parse_paths([self.document], cms.select_paths([("z",)])), {}
+        )
+
+
+class TestMarkerScanner(unittest.TestCase):
+    @staticmethod
+    def scan(*chunks):
+        scanner = cms.MarkerScanner(b"<more/>")
+        for chunk in chunks:
+            scanner.feed(chunk)
+        return scanner.found
+
+    def test_marker_split_across_two_chunks(self):
+        self.assertTrue(self.scan(b"<data></data><mo", b"re/></rpc-reply>"))
+
+    def test_marker_split_across_short_chunks(self):
+        self.assertTrue(self.scan(b"<mo", b"re/", b">"))
+
+    def test_no_marker(self):
+        self.assertFalse(self.scan(b"<data><more", b"></more></data>", b"<more"))
+
+
 class TestCmsOnt(unittest.TestCase):
-    pass
+    def setUp(self):
+        self.client = CmsClient()
+
+    @staticmethod
+    def onts_reply(*ont_ids):
+        return rpc_reply(
+            "".join(
+                f"<object><type>Ont</type><id><ont>{ont_id}</ont></id>"
+                f"<descr>ont {ont_id}</descr></object>"
+                for ont_id in ont_ids
+            )
+        )
+
+    def test_get_onts(self):
+        with reply(self.client, self.onts_reply("1", "2")):
+            onts = self.client.get_onts("node", ["1", "2"])
+        self.assertEqual(
+            [(ont.id, ont.description) for ont in onts],
+            [("1", "ont 1"), ("2", "ont 2")],
+        )
+
+    def test_get_onts_single(self):
+        with reply(self.client, self.onts_reply("1")):
+            onts = self.client.get_onts("node", ["1"])
+        self.assertEqual([(ont.id, ont.description) for ont in onts], [("1", "ont 1")])
+
+    def test_get_onts_without_ids(self):
+        with reply(self.client) as post:
+            self.assertEqual(self.client.get_onts("node", []), [])
+        post.assert_not_called()
+
+    def test_get_ont_not_found(self):
+        with reply(self.client, self.onts_reply()):
+            ont = self.client.get_ont("node", "1")
+        self.assertEqual((ont.id, ont.description), ("1", None))
+        self.assertEqual(ont.battery_present, 0)
 
 
 class TestCmsModem(unittest.TestCase):
-    pass
+    def setUp(self):
+        self.client = CmsClient()
+
+    @staticmethod
+    def statuses_reply(*ports):
+        return rpc_reply(
+            "".join(
+                f"<object><type>DslPort</type><id><shelf>{shelf}</shelf><card>{card}</card>"
+                f"<dslport>{dslport}</dslport></id><op-stat>up</op-stat></object>"
+                for shelf, card, dslport in ports
+            )
+        )
+
+    def test_get_xdsl_statuses(self):
+        with reply(self.client, self.statuses_reply((1, 1, 1), (1, 2, 3))):
+            statuses = self.client.get_xdsl_statuses("node", [(1, 1, 1), (1, 2, 3)])
+        self.assertEqual(
+            [(s.shelf, s.card, s.interface, s.operational_status) for s in statuses],
+            [(1, 1, 1, "up"), (1, 2, 3, "up")],
+        )
+
+    def test_get_xdsl_statuses_single(self):
+        with reply(self.client, self.statuses_reply((1, 2, 3))):
+            statuses = self.client.get_xdsl_statuses("node", [(1, 2, 3)])
+        self.assertEqual(
+            [(s.shelf, s.card, s.interface) for s in statuses], [(1, 2, 3)]
+        )
+
+    def test_get_xdsl_statuses_without_ports(self):
+        with reply(self.client) as post:
+            self.assertEqual(self.client.get_xdsl_statuses("node", []), [])
+        post.assert_not_called()
+
+    def test_get_xdsl_statuses_empty_id(self):
+        with reply(
+            self.client, rpc_reply("<object><id/><op-stat>up</op-stat></object>")
+        ):
+            (status,) = self.client.get_xdsl_statuses("node", [(1, 2, 3)])
+        self.assertEqual((status.interface, status.operational_status), (None, "up"))